@@ -16,8 +16,9 @@ def main():
         print("Virtualenv: (none)")
     names = sorted(os.environ.keys())
     print(f"Env vars ({len(names)}):")
-    for name in names:
-        print(f" - {name}")
+    # One write for the whole list instead of a print() per variable
+    if names:
+        sys.stdout.write("\n".join(f" - {name}" for name in names) + "\n")
 
 if __name__ == "__main__":
     main()
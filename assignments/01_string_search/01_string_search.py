@@ -2,6 +2,9 @@
 # Title: Simple String Searching
 # Purpose: Simple string searching and analysis
 
+import re
+from collections import Counter
+
 # Sample excerpt given from the Hacker Manifesto
 excerpt = """Another one got caught today, it's all over the papers. \
 Teenager Arrested in Computer Crime Scandal, Hacker Arrested after Bank \
@@ -18,20 +21,31 @@ print(excerpt)
 char_count = len(excerpt)
 #display character count
 print(f"\nFound...{char_count} characters.\n_____")
-# split the string into words and count them
-words = excerpt.split()
+# tokenize the string into words (punctuation stripped) in one regex pass and count them
+words = re.findall(r"[a-z']+", excerpt)
 word_count = len(words)
-#sort words in alphabetical order
-word_sort = sorted(words)
+#sort words in alphabetical order (sort unique words only, then expand by their counts)
+word_counts = Counter(words)
+word_sort = [word for word in sorted(word_counts) for _ in range(word_counts[word])]
 #display sorted word list and count
 print("\nSorted word list:")
 print(word_sort)
 print(f"\nFound...{word_count} words.\n_____")
 # searches for specific words and counts occurrences
 search_list = ["scandal", "arrested", "er", "good", "tomorrow"]
-search_list_results = {}
-for word in search_list:
-    search_list_results[word] = excerpt.count(word)
+# one compiled lookahead scans the excerpt once for every position where some term starts; it
+# consumes nothing, so a term inside a longer one (or overlapping another) is not hidden.
+# Each term then counts non-overlapping occurrences from those positions, as str.count does.
+search_pattern = re.compile("(?=" + "|".join(map(re.escape, search_list)) + ")")
+search_counts = Counter()
+next_free = {}
+for match in search_pattern.finditer(excerpt):
+    pos = match.start()
+    for word in search_list:
+        if pos >= next_free.get(word, 0) and excerpt.startswith(word, pos):
+            search_counts[word] += 1
+            next_free[word] = pos + len(word)
+search_list_results = {word: search_counts[word] for word in search_list}
 # display word search results and count
 print(f"\nWord search results:")
 for word, count in search_list_results.items():
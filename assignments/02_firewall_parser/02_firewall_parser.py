@@ -6,6 +6,9 @@
 from pathlib import Path
 import sys
 
+# Read buffer for the binary log scan (1 MiB); bytes avoid per-line UTF-8 decoding
+READ_BUFFER_SIZE = 1 << 20
+
 
 def main() -> int:
     # Allow optional filename argument; default to "redhat.txt" in the current working directory
@@ -22,20 +25,26 @@ def main() -> int:
               "  python3 assignments/02_firewall_parser/02_firewall_parser.py /path/to/redhat.txt")
         return 1
 
-    unique_worms: set[str] = set()
+    unique_worms: set[bytes] = set()
 
     try:
-        with path.open('r', encoding='utf-8', errors='ignore') as log_file:
+        with path.open('rb', buffering=READ_BUFFER_SIZE) as log_file:
             for each_line in log_file:
-                for token in each_line.split():
-                    if "worm" in token.lower():
+                # Lowercase each line once and skip lines without a match before splitting
+                lowered = each_line.lower()
+                if b"worm" not in lowered:
+                    continue
+                # bytes.lower() only touches ASCII letters, so both splits line up token for token
+                for token, low_token in zip(each_line.split(), lowered.split()):
+                    if b"worm" in low_token:
                         unique_worms.add(token)
     except Exception as e:
         print(f"Error reading file {path}: {e}")
         return 1
 
     # Case-insensitive sort for friendlier output while preserving original token case
-    for token in sorted(unique_worms, key=lambda s: s.lower()):
+    # Decode only the matched tokens, once, at print time
+    for token in sorted({t.decode('utf-8', 'ignore') for t in unique_worms}, key=lambda s: s.lower()):
         print(token)
 
     return 0
@@ -5,30 +5,45 @@
 # Import Python Standard Libraries
 
 import os  # File system library
+import stat  # File mode constants
 import time  # Time Conversion Library
-from binascii import hexlify  # hexlify module
+from concurrent.futures import ThreadPoolExecutor  # batched header reads
+
+# Readability check from a stat result (replaces a separate os.access syscall)
+def IsReadable(stats):
+    if not hasattr(os, "geteuid"):
+        return bool(stats.st_mode & stat.S_IRUSR)
+    euid = os.geteuid()
+    if euid == 0:
+        return True
+    if stats.st_uid == euid:
+        return bool(stats.st_mode & stat.S_IRUSR)
+    if stats.st_gid == os.getegid() or stats.st_gid in os.getgroups():
+        return bool(stats.st_mode & stat.S_IRGRP)
+    return bool(stats.st_mode & stat.S_IROTH)
 
 # FileProcessor Class Definition and Methods
 # Class Constructor Method: extracts file metadata and stores as instance attributes
 
 class FileProcessor:
 
-    def __init__(self, path):
+    def __init__(self, path, stats=None):
 
         try:
             self.filePath = path
 
-            if os.path.isfile(self.filePath) and os.access(self.filePath, os.R_OK):
-
-                # pulls the file metadata
+            # pulls the file metadata once (reuses the cached os.scandir result when given)
+            if stats is None:
                 stats = os.stat(self.filePath)
 
-                # store each as an instance attribute
+            if stat.S_ISREG(stats.st_mode) and IsReadable(stats):
+
+                # store each as an instance attribute (raw values; formatted when printed)
                 self.fileSize = stats.st_size
-                self.fileCreatedTime = time.ctime(stats.st_ctime)
-                self.fileModifiedTime = time.ctime(stats.st_mtime)
-                self.fileAccessTime = time.ctime(stats.st_atime)
-                self.fileMode = '{:016b}'.format(stats.st_mode)
+                self.fileCreatedTime = stats.st_ctime
+                self.fileModifiedTime = stats.st_mtime
+                self.fileAccessTime = stats.st_atime
+                self.fileMode = stats.st_mode
                 self.fileUID = stats.st_uid
                 self.fileHeader = ''
                 self.status = "OK"
@@ -43,8 +58,7 @@ class FileProcessor:
     def GetFileHeader(self):
         try:
             with open(self.filePath, 'rb') as fileObject:
-                header = fileObject.read(20)
-                self.fileHeader = hexlify(header)
+                self.fileHeader = fileObject.read(20).hex()
                 self.status = "OK"
         except Exception as err:
             self.status = err
@@ -55,10 +69,10 @@ class FileProcessor:
             print("\n================== File Details ========================")
             print("Path:          ", self.filePath)
             print("Size:          ", self.fileSize)
-            print("Last Modified: ", self.fileModifiedTime)
-            print("Last Accessed: ", self.fileAccessTime)
-            print("Created:       ", self.fileCreatedTime)
-            print("Mode:          ", self.fileMode)
+            print("Last Modified: ", time.ctime(self.fileModifiedTime))
+            print("Last Accessed: ", time.ctime(self.fileAccessTime))
+            print("Created:       ", time.ctime(self.fileCreatedTime))
+            print("Mode:          ", '{:016b}'.format(self.fileMode))
             print("UserID:        ", self.fileUID)
             print("Header:        ", self.fileHeader)
             print("=========================================================")
@@ -88,35 +102,44 @@ while True:
         print("Invalid Directory ... please try again")
         continue
     else:
-        # pull the list of items in the directory path
-        fileList = os.listdir(dirPath)
-
-        for possibleFile in fileList:
-
-            # convert the simple filename to the full and absolute path
-            fullPath = os.path.join(dirPath, possibleFile)
-            absPath = os.path.abspath(fullPath)
+        # pull the list of items in the directory path; resolve the directory once
+        # so every entry path is already absolute
+        with os.scandir(os.path.abspath(dirPath)) as fileList:
+            entries = list(fileList)
+
+        # build every FileProcessor first so the header reads can be batched
+        processed = []
+        for entry in entries:
+            try:
+                entryStats = entry.stat()
+            except OSError:
+                entryStats = None
+            fileObj = FileProcessor(entry.path, entryStats)
+            processed.append((fileObj, entryStats, fileObj.status == 'OK'))
+
+        # invoke GetFileHeader for all readable files at once; the small open/read/close
+        # calls overlap across worker threads instead of running one after another
+        readable = [fileObj for fileObj, _, accessible in processed if accessible]
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2)) as executor:
+            list(executor.map(FileProcessor.GetFileHeader, readable))
+
+        for fileObj, entryStats, accessible in processed:
+
+            absPath = fileObj.filePath
 
             # Only process files that we have rights to read
-            fileObj = FileProcessor(absPath)
-            if fileObj.status == 'OK':
-
-                # verify that the fileObj was created successfully
-                if fileObj.status == 'OK':
-                    # invoke the GetFileHeader method
-                    fileObj.GetFileHeader()
-                    if fileObj.status == "OK":
-                        fileObj.PrintFileDetails()
-                        if fileObj.status == "OK":
-                            continue
-                        else:
-                            fileObj.PrintException()
-                    else:
-                        fileObj.PrintException()
-                else:
-                    fileObj.PrintException()
-            else:
-                if os.path.isfile(absPath):
+            if not accessible:
+                if entryStats is not None and stat.S_ISREG(entryStats.st_mode):
                     print("\nAccess Denied ", absPath)
                 else:
                     print("\nEntry not a File ", absPath)
+                continue
+
+            # header was already read by the batch above; report a failed read
+            if fileObj.status != 'OK':
+                fileObj.PrintException()
+                continue
+
+            fileObj.PrintFileDetails()
+            if fileObj.status != 'OK':
+                fileObj.PrintException()
@@ -1,6 +1,6 @@
 # Kyle Versluis, 09/27/2025, Assignment 7
 # Title: Extracting Indicators from Memory Dumps
-# Purpose: Extracts e-mail addresses and URLs from a memory dump in chunked binary reads.
+# Purpose: Extracts e-mail addresses and URLs from a memory dump via a read-only memory map.
 
 # Notes: Uses regular expressions to find e-mail addresses and URLs. Report unique values
 # and optionally shows occurrence counts.
@@ -8,21 +8,54 @@
 Requires Python 3.6+
 3rd party dependencies:
 pip install prettytable
+Optional (faster scans on large dumps):
+pip install hyperscan       (preferred)
+pip install google-re2      (linear-time DFA engine, used when hyperscan is missing)
+pip install orjson          (faster --json-out serialization)
 
 Usage:
   python3 extract_indicators.py /path/to/memdump.bin [--chunk-size BYTES] [--overlap BYTES] /
   [--json-out out.json] [--show-counts]
 """
 import argparse                         # For command-line parsing
+import heapq                            # For top-N selection
 import json                             # For JSON output
+import mmap                             # For zero-copy scanning of the dump
+import multiprocessing                  # For scanning large dumps across cores
+import os                               # For file size checks
 import re                               # For regular expression matching
 import sys                              # For exit codes
-from typing import Dict, Set, Tuple     # For type hints
+from collections import Counter         # For C-level occurrence counting
+from typing import Dict, Iterator, Optional, Set, Tuple  # For type hints
 from pathlib import Path                # For path manipulations
 
+# Optional: Intel Hyperscan locates candidate regions in one SIMD pass (pip install hyperscan)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except Exception:
+    HYPERSCAN_AVAILABLE = False
+
+# Optional: Google RE2 runs the candidate patterns on a linear-time DFA (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except Exception:
+    RE2_AVAILABLE = False
+
+# Optional: orjson serializes --json-out results straight to UTF-8 bytes (pip install orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
 # Default I/O parameters
 DEFAULT_CHUNK_SIZE = 1024 * 1024        # 1 MiB
 DEFAULT_OVERLAP = 2048                  # bytes kept between chunks to catch boundary-spanning matches
+PARALLEL_THRESHOLD = 32 * 1024 * 1024   # dumps at least this large are scanned by a process pool
+WINDOWS_PER_WORKER = 4                  # windows per worker process, for load balancing
+TOP_COUNTS = 50                         # rows shown per list with --show-counts
 
 
 # Helper function to find the default directory relative to this script.
@@ -49,13 +82,56 @@ def repo_default_dir() -> Path:
     return Path.cwd()
 
 DEFAULT_DIR = repo_default_dir()
-print(f"[info] Using default directory: {DEFAULT_DIR}")
+# worker processes re-import this module (as __mp_main__) on spawn platforms; only announce once
+if __name__ == '__main__':
+    print(f"[info] Using default directory: {DEFAULT_DIR}")
 # ----------------------------------------------------------------------------------------------
 
-# Regular expressions for e-mails and URLs. ePatt and uPatt are compiled once.
-# ePatt: e-mail addresses and URLs
-ePatt = re.compile(rb'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,4}')
-uPatt = re.compile(rb'\w+:\/\/[\w@][\w.:@]+\/?[\w\.?=%&=\-@$,]*')
+# Regular expressions for e-mails and URLs, compiled once.
+# EMAIL_CANDIDATE/URL_CANDIDATE are the plain e-mail and URL expressions. Hyperscan and RE2 run
+# them as-is: both engines are linear-time and support no lookbehind.
+EMAIL_CANDIDATE = rb'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,4}'
+URL_CANDIDATE = rb'\w+:\/\/[\w@][\w.:@]+\/?[\w\.?=%&=\-@$,]*'
+
+# ePatt/uPatt (e-mail addresses and URLs) add a leading lookbehind so a match can only start at
+# the beginning of a character run. Without it, every offset inside a long run of junk re-scans
+# the run to its end (quadratic time on dumps full of near-misses). A match starting inside a run
+# implies one starting at the run's beginning, so the lookbehind only hides a match that begins
+# right where the previous one ended (e.g. after a four-letter TLD); findMatches retries that
+# position with eResume/uResume, so the results are exactly those of the plain expressions.
+ePatt = re.compile(rb'(?<![A-Za-z0-9._%+-])' + EMAIL_CANDIDATE)
+uPatt = re.compile(rb'(?<!\w)' + URL_CANDIDATE)
+eResume = re.compile(EMAIL_CANDIDATE)
+uResume = re.compile(URL_CANDIDATE)
+
+# Bytes that can never appear inside an e-mail or URL match. Cutting the dump at one of these
+# gives windows that scan independently with exactly the same matches as one full pass.
+sepPatt = re.compile(rb'[^A-Za-z0-9._%+\-@:/?=&$,]')
+
+# RE2 versions of the candidate patterns (e-mail, URL), or None when RE2 is unavailable. These are
+# the same expressions ePatt/uPatt reproduce, so every engine reports the same matches.
+re2Patterns = None
+if RE2_AVAILABLE:
+    try:
+        re2Patterns = (re2.compile(EMAIL_CANDIDATE), re2.compile(URL_CANDIDATE))
+    except Exception:
+        re2Patterns = None
+
+# Hyperscan database for the candidate expressions (ids 0 = e-mail, 1 = URL), built once at import.
+# Hyperscan reports every match end rather than Python's non-overlapping matches, so it is only
+# used to find the regions that contain matches; ePatt/uPatt then run over those regions alone.
+hsDatabase = None
+if HYPERSCAN_AVAILABLE:
+    try:
+        hsDatabase = hyperscan.Database()
+        hsDatabase.compile(
+            expressions=[EMAIL_CANDIDATE, URL_CANDIDATE],
+            ids=[0, 1],
+            elements=2,
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+        )
+    except Exception:
+        hsDatabase = None
 
 # Helper functions
 # ----------------------------------------------------------------------------------------------
@@ -63,7 +139,87 @@ uPatt = re.compile(rb'\w+:\/\/[\w@][\w.:@]+\/?[\w\.?=%&=\-@$,]*')
 def byte2string(b: bytes) -> str:
     return b.decode('utf-8', errors='replace')
 
-# scans a binary file for emails and URLs using chunked reads with overlap
+# merges (start, end) hits that overlap or touch into sorted, disjoint regions
+def mergeRegions(hits: list) -> list:
+    regions: list = []
+    for start, end in sorted(hits):
+        if regions and start <= regions[-1][1] + 1:
+            regions[-1][1] = max(regions[-1][1], end)
+        else:
+            regions.append([start, end])
+    return regions
+
+# yields the matches of patt within buf[pos:endpos], same as finditer with its lookbehind-free form;
+# each match's end is first tried with resume, since the lookbehind would reject a start there
+def findMatches(patt: re.Pattern, resume: re.Pattern, buf, pos: int = 0,
+                endpos: int = sys.maxsize) -> Iterator[re.Match]:
+    m = resume.match(buf, pos, endpos) or patt.search(buf, pos, endpos)
+    while m is not None:
+        yield m
+        pos = m.end()
+        m = resume.match(buf, pos, endpos) or patt.search(buf, pos, endpos)
+
+# yields pattern matches found only within the given regions of buf, same as a full-buffer scan
+def regionMatches(patt: re.Pattern, resume: re.Pattern, buf, regions: list) -> Iterator[bytes]:
+    last_end = 0
+    for start, end in regions:
+        # one extra byte of right context keeps end-of-match checks identical to a full scan
+        for m in findMatches(patt, resume, buf, max(start, last_end), min(end + 1, len(buf))):
+            last_end = m.end()
+            yield m.group()
+
+# scans buf once with Hyperscan and returns (e-mail matches, URL matches) iterators
+def hyperscanMatches(buf) -> Tuple[Iterator[bytes], Iterator[bytes]]:
+    hits: Tuple[list, list] = ([], [])
+
+    def onMatch(pattern_id, start, end, flags, context):
+        hits[pattern_id].append((start, end))
+
+    hsDatabase.scan(buf, match_event_handler=onMatch)
+    return (regionMatches(ePatt, eResume, buf, mergeRegions(hits[0])),
+            regionMatches(uPatt, uResume, buf, mergeRegions(hits[1])))
+
+# returns (e-mail matches, URL matches) iterators for buf using the fastest available engine
+def scanBuffer(buf) -> Tuple[Iterator[bytes], Iterator[bytes]]:
+    # the match generators stream matches into the counters instead of materializing a list first
+    if hsDatabase is not None:
+        return hyperscanMatches(buf)
+    if re2Patterns is not None:
+        # RE2 only accepts bytes, so a memory map or view is copied once for its scan
+        data = buf if isinstance(buf, bytes) else bytes(buf)
+        return re2Patterns[0].findall(data), re2Patterns[1].findall(data)
+    return ((m.group() for m in findMatches(ePatt, eResume, buf)),
+            (m.group() for m in findMatches(uPatt, uResume, buf)))
+
+# splits [0, size) into about count windows, each cut at a byte that no match can contain
+def windowBounds(mm, size: int, count: int) -> list:
+    step = -(-size // count)
+    bounds = [0]
+    for pos in range(step, size, step):
+        if pos <= bounds[-1]:
+            continue
+        sep = sepPatt.search(mm, pos)
+        if sep is None:
+            break
+        bounds.append(sep.start())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+# pool worker: maps the dump itself (mmaps cannot be pickled) and counts one window
+def scanWindow(task: Tuple[str, int, int]) -> Tuple[Counter, Counter]:
+    path, start, end = task
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # a memoryview slice scans the window in place instead of copying it into a bytes object
+        window = memoryview(mm)[start:end]
+        emails, urls = scanBuffer(window)
+        counts = Counter(emails), Counter(urls)
+        # drop every export of the map before it is closed
+        del emails, urls
+        window.release()
+    return counts
+
+# scans a binary file for emails and URLs over a memory map
+# (chunk_size/overlap are validated for CLI compatibility; the mmap scan has no chunk boundaries)
 def fileScan(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEFAULT_OVERLAP
              ) -> Tuple[Dict[bytes, int], Dict[bytes, int], Set[bytes], Set[bytes]]:
     if overlap < 0:
@@ -72,43 +228,33 @@ def fileScan(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEF
         raise ValueError("chunk_size must be > 0")
 
     # Initialize counts and sets
-    email_counts: Dict[bytes, int] = {}
-    url_counts: Dict[bytes, int] = {}
-    email_set: Set[bytes] = set()
-    url_set: Set[bytes] = set()
+    email_counts: Dict[bytes, int] = Counter()
+    url_counts: Dict[bytes, int] = Counter()
 
-    # try to open the file and read in chunks
+    # try to open the file and scan it through a read-only memory map; the whole dump is
+    # one buffer, so there are no chunk boundaries to overlap
     try:
         with open(path, 'rb') as f:
-            buffer = b''
-            # read in chunks, looping until EOF and records matches
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    scan_region = buffer
-                    if scan_region:
-                        for match in ePatt.findall(scan_region):
-                            email_set.add(match)
-                            email_counts[match] = email_counts.get(match, 0) + 1
-                        for match in uPatt.findall(scan_region):
-                            url_set.add(match)
-                            url_counts[match] = url_counts.get(match, 0) + 1
-                    break
-
-                buffer += chunk
-
-                # Process the buffer if it exceeds the overlap size and retain overlap
-                if len(buffer) > overlap:
-                    scan_region = buffer[:-overlap]
-                    buffer = buffer[-overlap:]
-
-                    # Find matches in the scan region and add to sets
-                    for match in ePatt.findall(scan_region):
-                        email_set.add(match)
-                        email_counts[match] = email_counts.get(match, 0) + 1
-                    for match in uPatt.findall(scan_region):
-                        url_set.add(match)
-                        url_counts[match] = url_counts.get(match, 0) + 1
+            # mmap cannot map an empty file; there is nothing to scan in that case
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size = len(mm)
+                    workers = os.cpu_count() or 1
+                    if size >= PARALLEL_THRESHOLD and workers > 1:
+                        # Large dump: count independent windows in parallel and merge
+                        tasks = [(path, start, end)
+                                 for start, end in windowBounds(mm, size, workers * WINDOWS_PER_WORKER)]
+                        # (update() merges in place; += would rescan the whole total per window)
+                        with multiprocessing.Pool(workers) as pool:
+                            for emails, urls in pool.imap_unordered(scanWindow, tasks):
+                                email_counts.update(emails)
+                                url_counts.update(urls)
+                    else:
+                        # Count matches across the whole mapping in this process; each Counter is
+                        # built in one C-level pass over the match stream
+                        emails, urls = scanBuffer(mm)
+                        email_counts = Counter(emails)
+                        url_counts = Counter(urls)
     # handle errors
     except FileNotFoundError:
         print(f"Error: file not found: {path}", file=sys.stderr)
@@ -117,15 +263,22 @@ def fileScan(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEF
         print(f"Error: permission denied: {path}", file=sys.stderr)
         sys.exit(2)
 
+    # unique values are simply the counted keys
+    email_set: Set[bytes] = set(email_counts)
+    url_set: Set[bytes] = set(url_counts)
     return email_counts, url_counts, email_set, url_set
 
 # converts a set of bytes to a sorted list of strings
 def sortedStrings(items: Set[bytes]) -> list:
     return sorted((byte2string(x) for x in items), key=lambda s: (s.lower(), s))
 
-# converts a counts dict to a sorted list of tuples (string, count)
-def countsSortedStrings(counts: Dict[bytes, int]) -> list:
-    return sorted(((byte2string(k), v) for k, v in counts.items()), key=lambda kv: (-kv[1], kv[0].lower()))
+# converts a counts dict to a sorted list of tuples (string, count); with limit, only the
+# first limit rows are kept, selected with a bounded heap instead of sorting every key
+def countsSortedStrings(counts: Dict[bytes, int], limit: Optional[int] = None) -> list:
+    rows = ((byte2string(k), v) for k, v in counts.items())
+    if limit is not None:
+        return heapq.nsmallest(limit, rows, key=lambda kv: (-kv[1], kv[0].lower()))
+    return sorted(rows, key=lambda kv: (-kv[1], kv[0].lower()))
 # ----------------------------------------------------------------------------------------------
 
 # Main function: parse command-line arguments and run the scan
@@ -151,19 +304,16 @@ def main() -> int:
     # display counts if requested
     if args.show_counts:
         print("\nTop e-mail occurrences:")
-        for email, cnt in countsSortedStrings(email_counts)[:50]:
-            print(f"{cnt:6d}  {email}")
+        sys.stdout.write("".join(f"{cnt:6d}  {email}\n" for email, cnt in countsSortedStrings(email_counts, TOP_COUNTS)))
         print("\nTop URL occurrences:")
-        for url, cnt in countsSortedStrings(url_counts)[:50]:
-            print(f"{cnt:6d}  {url}")
+        sys.stdout.write("".join(f"{cnt:6d}  {url}\n" for url, cnt in countsSortedStrings(url_counts, TOP_COUNTS)))
 
+    # each list goes out in one write instead of a print() per value
     print("\nAll e-mails:")
-    for s in emails_sorted:
-        print(s)
+    sys.stdout.write("".join(s + "\n" for s in emails_sorted))
 
     print("\nAll URLs:")
-    for s in urls_sorted:
-        print(s)
+    sys.stdout.write("".join(s + "\n" for s in urls_sorted))
 
     # Offer to save results as JSON if requested
     if args.json_out:
@@ -173,8 +323,13 @@ def main() -> int:
         }
         # write JSON output
         try:
-            with open(args.json_out, 'w', encoding='utf-8') as out:
-                json.dump(result, out, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                # same layout as json.dump(indent=2, ensure_ascii=False), already encoded
+                with open(args.json_out, 'wb') as out:
+                    out.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            else:
+                with open(args.json_out, 'w', encoding='utf-8') as out:
+                    json.dump(result, out, indent=2, ensure_ascii=False)
             print(f"\nWrote JSON results to {args.json_out}")
         except Exception as e:
             print(f"Failed to write JSON output: {e}", file=sys.stderr)
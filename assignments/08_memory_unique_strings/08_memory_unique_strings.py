@@ -4,9 +4,8 @@
 # report their occurrence counts in a PrettyTable sorted by the highest count.
 
 # Notes:
-# - Reads the file in chunks with an overlap window so matches that span chunk
-#   boundaries are captured. For this pattern, a max length of 15, an overlap of 14
-#   bytes is enough and used by default.
+# - Scans the file through a read-only memory map, so matches never span chunk
+#   boundaries. The --chunk-size/--overlap options are kept for compatibility.
 # - Requires the prettytable package for tabular output
 """
 - Requires Python 3.6+
@@ -18,8 +17,12 @@ Usage:
 """
 
 import argparse                                 # For command-line parsing
+import mmap                                     # For zero-copy scanning of the dump
+import multiprocessing                          # For scanning large dumps across cores
+import os                                       # For file size checks
 import re                                       # For regular expression matching
 import sys                                      # For exit codes
+from collections import Counter                 # For C-level occurrence counting
 from typing import Dict, Iterable, Tuple        # For type hints
 from prettytable import PrettyTable             # For formatted table output
 from pathlib import Path
@@ -27,6 +30,8 @@ from pathlib import Path
 # Default streaming parameters
 DEFAULT_CHUNK_SIZE = 1024 * 1024                # 1 MiB
 DEFAULT_OVERLAP = 14                            # because the max token length is 15
+PARALLEL_THRESHOLD = 32 * 1024 * 1024           # dumps at least this large are scanned by a process pool
+WINDOWS_PER_WORKER = 4                          # windows per worker process, for load balancing
 
 # Helper function to find the default directory relative to this script.
 """
@@ -52,22 +57,48 @@ def repo_default_dir() -> Path:
     return Path.cwd()
 
 DEFAULT_DIR = repo_default_dir()
-print(f"[info] Using default directory: {DEFAULT_DIR}")
+# worker processes re-import this module (as __mp_main__) on spawn platforms; only announce once
+if __name__ == '__main__':
+    print(f"[info] Using default directory: {DEFAULT_DIR}")
 
 
 # Word regex: continuous alphabetical strings 5-15 chars long
 wPatt = re.compile(rb'[A-Za-z]{5,15}')
+# Any non-letter byte ends a word; cutting the dump at one gives windows that scan independently
+sepPatt = re.compile(rb'[^A-Za-z]')
 
 # Helper functions
 # ----------------------------------------------------------------------------------------------
 
 # Count matches in the given bytes region and update counts dict
-def matchCount(region: bytes, counts: Dict[bytes, int]) -> None:
-    """Update counts with matches found within the given bytes region."""
-    for m in wPatt.findall(region):
-        counts[m] = counts.get(m, 0) + 1
+def matchCount(region: bytes, counts: Counter, start: int = 0, end: int = sys.maxsize) -> None:
+    """Update counts with matches found within region[start:end] (without copying it)."""
+    # finditer streams matches into the counter instead of building a list of every match
+    counts.update(m.group() for m in wPatt.finditer(region, start, end))
+
+# Split [0, size) into about count windows, each cut at a non-letter byte.
+def windowBounds(mm, size: int, count: int) -> list:
+    step = -(-size // count)
+    bounds = [0]
+    for pos in range(step, size, step):
+        if pos <= bounds[-1]:
+            continue
+        sep = sepPatt.search(mm, pos)
+        if sep is None:
+            break
+        bounds.append(sep.start())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+# Pool worker: maps the dump itself (mmaps cannot be pickled) and counts one window.
+def scanWindow(task: Tuple[str, int, int]) -> Counter:
+    path, start, end = task
+    counts: Counter = Counter()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        matchCount(mm, counts, start, end)
+    return counts
 
-# Scan a binary file for the word pattern using chunked reads with overlap and update counts dict.
+# Scan a binary file for the word pattern over a memory map and update counts dict.
 def wordScan(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEFAULT_OVERLAP) -> Dict[bytes, int]:
     if overlap < 0:
         raise ValueError("overlap must be >= 0")
@@ -75,29 +106,28 @@ def wordScan(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEF
         raise ValueError("chunk_size must be > 0")
 
     # Initialize counts dict
-    counts: Dict[bytes, int] = {}
+    counts: Dict[bytes, int] = Counter()
 
-    # try to open the file and read in chunks
+    # try to open the file and scan it through a read-only memory map; the whole dump is
+    # one buffer, so there are no chunk boundaries to overlap
     try:
         with open(path, 'rb') as f:
-            buffer = b''
-
-            # read in chunks, looping until EOF and records matches
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    # Process whatever remains in the buffer
-                    if buffer:
-                        matchCount(buffer, counts)
-                    break
-
-                buffer += chunk
-
-                # Process the buffer if it exceeds the overlap size and retain overlap
-                if len(buffer) > overlap:
-                    scan_region = buffer[:-overlap]
-                    buffer = buffer[-overlap:]
-                    matchCount(scan_region, counts)
+            # mmap cannot map an empty file; there is nothing to scan in that case
+            if os.fstat(f.fileno()).st_size == 0:
+                return counts
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                workers = os.cpu_count() or 1
+                if size >= PARALLEL_THRESHOLD and workers > 1:
+                    # Large dump: count independent windows in parallel and merge
+                    tasks = [(path, start, end)
+                             for start, end in windowBounds(mm, size, workers * WINDOWS_PER_WORKER)]
+                    # (update() merges in place; += would rescan the whole total per window)
+                    with multiprocessing.Pool(workers) as pool:
+                        for window_counts in pool.imap_unordered(scanWindow, tasks):
+                            counts.update(window_counts)
+                else:
+                    matchCount(mm, counts)
     # handle errors
     except FileNotFoundError:
         print(f"Error: file not found: {path}", file=sys.stderr)
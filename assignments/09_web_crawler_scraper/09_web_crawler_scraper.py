@@ -7,29 +7,44 @@
 # The script only downloads images that are also hosted on the same approved host.
 # If the page includes external resources, such as 3rd party links, they are skipped.
 
-# Requires Python 3.6+
+# Requires Python 3.9+
 # 3rd party dependencies: requests, beautifulsoup4
 # pip install requests beautifulsoup4
+# Optional: selectolax (C-based HTML parser, used instead of BeautifulSoup when installed)
+# pip install selectolax
 
 # Usage: python3 web_crawler_scraper.py https://approved-website.edu/ --depth 2 --output IMAGES
 
 # Standard Libraries
 import argparse                                             # for command-line parsing
+import asyncio                                              # for concurrent page fetches
 import hashlib                                              # for image/content hashing
 import os                                                   # for filesystem operations
 import sys                                                  # for exit codes
-import time                                                 # for throttling
+import tempfile                                             # for partial image downloads
+import threading                                            # for guarding shared image state
 import random                                               # for random delay
+import re                                                   # for tracking-parameter matching
+from concurrent.futures import ThreadPoolExecutor          # for concurrent image downloads
+from functools import lru_cache                             # for memoizing URL helpers
 from pathlib import Path                                    # for path manipulations
-from typing import Set, Tuple                               # for type hints
+from typing import Optional, Set, Tuple                     # for type hints
 
 # for URL manipulation
 from urllib.parse import urljoin, urlparse, urldefrag, urlunparse, parse_qsl, urlencode
 
 # 3rd Party Libraries
 import requests                                             # for HTTP requests
+from requests.adapters import HTTPAdapter                   # for connection pooling
 from bs4 import BeautifulSoup                               # for HTML parsing
 
+# Optional fast HTML parser (Lexbor, written in C); BeautifulSoup's html.parser is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser            # selectolax 0.3.x+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 # ---------- Configuration Defaults ----------------
 COMMON_UA = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -39,35 +54,51 @@ REQUEST_TIMEOUT = 15                                        # seconds
 URL_PROTOCOLS = {"http", "https"}                           # allowed URL protocols
 
 # Request pacing
-SLEEP_MIN = 0.5                                             # jittered sleep lower bound (seconds)
-SLEEP_MAX = 2.0                                             # jittered sleep upper bound (seconds)
-SLEEP_BETWEEN_PAGES = 1.0                                   # base delay between page requests (seconds)
+SLEEP_BETWEEN_PAGES = 1.0                                   # max jitter before each page request (seconds)
+PAGE_CONCURRENCY = 8                                        # page requests in flight per crawl level
+IMAGE_CONCURRENCY = 6                                       # image downloads in flight per page
+
+# Connection pooling
+POOL_CONNECTIONS = 16                                       # number of host pools to cache
+POOL_MAXSIZE = 32                                           # keep-alive connections per host pool
+
+# URL helper memoization (nav links and logos repeat on nearly every page)
+URL_CACHE_SIZE = 4096                                       # cached results per URL helper
 
 # Tracking params to strip from all URLs we resolve
 TRACKING_PREFIXES = tuple(p.lower() for p in [
     "utm_", "gclid", "fbclid", "sessionid", "jsessionid"
 ])
+# One case-insensitive prefix match per query key instead of a lower() + startswith() per prefix
+TRACKING_RE = re.compile("|".join(re.escape(pref) for pref in TRACKING_PREFIXES), re.IGNORECASE)
 # --------------------------------------------------
 
-# sleeps for a random duration in [min_s, max_s]
-def sleep_jitter(min_s: float = SLEEP_MIN, max_s: float = SLEEP_MAX):
-    time.sleep(random.uniform(min_s, max_s))
+# Shared session: reuses keep-alive TCP/TLS connections across every page and image request
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": COMMON_UA})
+_adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# image downloads run on worker threads; this guards the shared digest set
+IMAGE_LOCK = threading.Lock()
 
 # Strips tracking parameters from a URL
 def strip_tracking(u: str):
-    from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
     p = urlparse(u)
     q = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=False)
-         if not any(k.lower().startswith(pref) for pref in TRACKING_PREFIXES)]
+         if not TRACKING_RE.match(k)]
     return urlunparse(p._replace(query=urlencode(q, doseq=True)))
 
 # resolves link relative to current_url and strips any URL fragments
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def url_cleanup(current_url: str, link: str):
     absolute = urljoin(current_url, link)
     absolute, fragment = urldefrag(absolute)
     return strip_tracking(absolute)
 
 # Ensures that the URL resolves to the same host as the approved_netloc
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def stay_on_site(url: str, approved_netloc: str):
     p = urlparse(url)
     if p.scheme not in URL_PROTOCOLS:
@@ -104,27 +135,67 @@ def safe_image_filename(img_url: str):
             name = name + ext
     return name
 
-# fetches a URL and parses it with BeautifulSoup
-def fetch(url: str) -> Tuple[requests.Response, BeautifulSoup]:
-    headers = {"User-Agent": COMMON_UA}
-    fetch_response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+# parses page HTML with selectolax when available, otherwise with BeautifulSoup
+def parse_html(html: str):
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, "html.parser")
+
+# returns the stripped page title, or None when the page has no usable title
+def page_title(tree):
+    if SELECTOLAX_AVAILABLE:
+        node = tree.css_first("title")
+        return node.text(strip=True) if node is not None else None
+    return tree.title.string.strip() if tree.title and tree.title.string else None
+
+# yields the value of attr for every tag that carries it (e.g. a[href], img[src])
+def tag_attrs(tree, tag: str, attr: str):
+    if SELECTOLAX_AVAILABLE:
+        for node in tree.css(f"{tag}[{attr}]"):
+            yield node.attributes.get(attr) or ""
+    else:
+        for node in tree.find_all(tag, **{attr: True}):
+            yield node.get(attr)
+
+# returns the page text with whitespace collapsed (used for near-duplicate detection)
+def page_text(tree) -> str:
+    if SELECTOLAX_AVAILABLE:
+        return " ".join(tree.root.text(separator=" ").split())
+    return " ".join(tree.get_text(" ").split())
+
+# fetches a URL and parses it (selectolax or BeautifulSoup)
+def fetch(url: str) -> Tuple[requests.Response, object]:
+    fetch_response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     fetch_response.raise_for_status()
     # Quick content-type guard for HTML pages
     content_type = fetch_response.headers.get("Content-Type", "").lower()
     if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
         raise ValueError(f"Non-HTML content type for page: {content_type!r}")
-    soup = BeautifulSoup(fetch_response.text, "html.parser")
-    return fetch_response, soup
+    tree = parse_html(fetch_response.text)
+    return fetch_response, tree
 
 # downloads an image if it is on the approved host and looks like an image.
-def download_image(img_url: str, out_dir: Path, approved_netloc: str):
+# seen_images (optional) holds content digests of saved images; an image whose bytes were already
+# saved under another URL is not saved again. (ETags are not used: servers often derive them from
+# mtime and size, so different files can share one.) done_urls (optional) holds image URLs already
+# handled in this crawl, so an image linked from many pages is fetched once.
+def download_image(img_url: str, out_dir: Path, approved_netloc: str,
+                   seen_images: Optional[Set[bytes]] = None, done_urls: Optional[Set[str]] = None):
     if not stay_on_site(img_url, approved_netloc):
         print(f"  [skip-img external] {img_url}")
         return False
 
-    headers = {"User-Agent": COMMON_UA}
+    # Claim the URL up front so concurrent pages never fetch it twice; a failure releases it
+    if done_urls is not None:
+        with IMAGE_LOCK:
+            if img_url in done_urls:
+                return True
+            done_urls.add(img_url)
+
+    tmp_path = None
+    image_digest = None
     try:
-        with requests.get(img_url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as download_response:
+        with SESSION.get(img_url, timeout=REQUEST_TIMEOUT, stream=True) as download_response:
             download_response.raise_for_status()
             content_type = download_response.headers.get("Content-Type", "").lower()
             if not content_type.startswith("image/"):
@@ -139,93 +210,163 @@ def download_image(img_url: str, out_dir: Path, approved_netloc: str):
                 print(f"  [image exists] {dest}")
                 return True
 
-            with open(dest, "wb") as image_data:
+            # Stream into a temp file next to dest, hashing as it goes; only a complete image that
+            # is not a duplicate is moved into place, so a failed download leaves nothing behind
+            fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".", suffix=".part")
+            digest = hashlib.blake2b(digest_size=16)
+            with open(fd, "wb") as image_data:
                 for chunk in download_response.iter_content(chunk_size=8192):
                     if chunk:
                         image_data.write(chunk)
+                        digest.update(chunk)
+            if seen_images is not None:
+                with IMAGE_LOCK:
+                    duplicate = digest.digest() in seen_images
+                    if not duplicate:
+                        seen_images.add(digest.digest())
+                        image_digest = digest.digest()
+                if duplicate:
+                    print(f"  [skip-img duplicate] {img_url}")
+                    return True
+
+            # Publish without replacing a file another URL saved under the same name meanwhile
+            # (a hard link fails if dest exists; os.replace is the fallback where links are unsupported)
+            try:
+                os.link(tmp_path, dest)
+            except FileExistsError:
+                print(f"  [image exists] {dest}")
+                # the digest stands for bytes that were not saved
+                if image_digest is not None:
+                    with IMAGE_LOCK:
+                        seen_images.discard(image_digest)
+                return True
+            except OSError:
+                os.replace(tmp_path, dest)
+                tmp_path = None
             print(f"  [image saved] {dest}")
             return True
     # image download error handling
     except Exception as e:
+        # release the URL and digest so a later page can try again
+        with IMAGE_LOCK:
+            if done_urls is not None:
+                done_urls.discard(img_url)
+            if image_digest is not None:
+                seen_images.discard(image_digest)
         print(f"  [image error] {img_url} -> {e}")
         return False
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 # extracts and prints info for a page and returns:
 # (set_of_links_found, set_of_image_srcs_found) as absolute URLs.
-def extract_and_print(page_url: str, soup: BeautifulSoup) -> Tuple[Set[str], Set[str]]:
-    title = (soup.title.string.strip() if soup.title and soup.title.string else "(no title)")
+def extract_and_print(page_url: str, tree) -> Tuple[Set[str], Set[str]]:
+    title = page_title(tree) or "(no title)"
     print(f"\n=== PAGE: {page_url}")
     print(f"TITLE: {title}")
 
     links = set()
-    for tag in soup.find_all("a", href=True):
-        href = tag.get("href").strip()
+    for href in tag_attrs(tree, "a", "href"):
+        href = href.strip()
         abs_url = url_cleanup(page_url, href)
         links.add(abs_url)
     if links:
-        print("URLS FOUND:")
-        for link in sorted(links):
-            print(f" {link}")
+        # one write for the whole list instead of a print() per link
+        sys.stdout.write("URLS FOUND:\n " + "\n ".join(sorted(links)) + "\n")
     else:
         print("URLS FOUND: 0")
 
     images = set()
-    for img in soup.find_all("img", src=True):
-        src = img.get("src").strip()
+    for src in tag_attrs(tree, "img", "src"):
+        src = src.strip()
         abs_src = url_cleanup(page_url, src)
         images.add(abs_src)
     if images:
-        print("IMAGES FOUND:")
-        for src in sorted(images):
-            print(f" {src}")
+        sys.stdout.write("IMAGES FOUND:\n " + "\n ".join(sorted(images)) + "\n")
     else:
         print("IMAGES FOUND: 0")
 
     return links, images
 
-# Recursive page crawler that stays on the approved site
-# Prints page info and downloads same-site images.
-def crawl(url: str, approved_netloc: str, out_dir: Path, depth: int, visited: Set[str], seen_hashes: Set[str])-> None:
-    if depth < 0:
-        return
-    if url in visited:
+# fetches one page under the shared concurrency limit; returns (response, tree) or the exception
+async def fetch_page(url: str, limiter: asyncio.Semaphore):
+    async with limiter:
+        # small jitter so concurrent requests do not hit the host in lockstep
+        await asyncio.sleep(random.uniform(0, SLEEP_BETWEEN_PAGES))
+        try:
+            # the pooled requests Session does the blocking I/O on a worker thread
+            return await asyncio.to_thread(fetch, url)
+        except Exception as e:
+            return e
+
+# Breadth-first page crawler that stays on the approved site.
+# Each depth level is fetched concurrently (at most PAGE_CONCURRENCY requests in flight), then
+# pages are processed in order: prints page info and downloads same-site images
+# (at most IMAGE_CONCURRENCY at a time).
+async def crawl_async(url: str, approved_netloc: str, out_dir: Path, depth: int, visited: Set[str], seen_hashes: Set[bytes]) -> None:
+    if depth < 0 or url in visited:
         return
     visited.add(url)
 
-    # Enforce same-site at the entry to avoid accidental off-site recursion
+    # Enforce same-site at the entry to avoid accidental off-site crawling
     if not stay_on_site(url, approved_netloc):
         print(f"[skip external page] {url}")
         return
 
-    try:
-        resp, soup = fetch(url)
-    except Exception as e:
-        print(f"[error] {url} -> {e}")
-        return
-
-    text = soup.get_text(" ", strip=True)[:10000]
-    content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-    if content_hash in seen_hashes:
-        print("[dedup-alert] Skipping similar page")
-        return
-    seen_hashes.add(content_hash)
-
-    links, images = extract_and_print(url, soup)
-
-    # Download images from the same approved site only with a small pause between each
-    for idx, img_url in enumerate(sorted(images)):
-        if idx > 0:                                             # sleep only BETWEEN downloads
-            time.sleep(random.uniform(0.5, 2.0))
-        download_image(img_url, out_dir, approved_netloc)
-
-    # Recurse into same-site links only
-    if depth > 0:
-        for link in sorted(links):
-            if stay_on_site(link, approved_netloc):
-                time.sleep(SLEEP_BETWEEN_PAGES)
-                crawl(link, approved_netloc, out_dir, depth - 1, visited, seen_hashes)
-            else:
-                print(f"[skip external link] {link}")
+    limiter = asyncio.Semaphore(PAGE_CONCURRENCY)
+    # image fingerprints for this crawl (16-byte content digests) and image URLs already handled
+    seen_images: Set[bytes] = set()
+    done_images: Set[str] = set()
+    loop = asyncio.get_running_loop()
+    frontier = [url]
+    with ThreadPoolExecutor(max_workers=IMAGE_CONCURRENCY) as image_pool:
+        for level in range(depth + 1):
+            results = await asyncio.gather(*(fetch_page(page_url, limiter) for page_url in frontier))
+            next_frontier = []
+
+            for page_url, result in zip(frontier, results):
+                if isinstance(result, Exception):
+                    print(f"[error] {page_url} -> {result}")
+                    continue
+                resp, tree = result
+
+                # Dedup only needs a fast non-cryptographic fingerprint; keep raw 16-byte digests
+                text = page_text(tree)[:10000]
+                content_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+                if content_hash in seen_hashes:
+                    print("[dedup-alert] Skipping similar page")
+                    continue
+                seen_hashes.add(content_hash)
+
+                links, images = extract_and_print(page_url, tree)
+
+                # Download images from the same approved site on the worker pool; its size caps
+                # the image requests in flight instead of spacing them out one by one
+                await asyncio.gather(*(
+                    loop.run_in_executor(image_pool, download_image, img_url, out_dir,
+                                         approved_netloc, seen_images, done_images)
+                    for img_url in sorted(images)))
+
+                # Queue same-site links for the next level only
+                if level < depth:
+                    for link in sorted(links):
+                        if link in visited:
+                            continue
+                        if stay_on_site(link, approved_netloc):
+                            visited.add(link)
+                            next_frontier.append(link)
+                        else:
+                            print(f"[skip external link] {link}")
+
+            frontier = next_frontier
+
+# Crawls from url up to depth link levels away (synchronous entry point)
+def crawl(url: str, approved_netloc: str, out_dir: Path, depth: int, visited: Set[str], seen_hashes: Set[bytes]) -> None:
+    asyncio.run(crawl_async(url, approved_netloc, out_dir, depth, visited, seen_hashes))
 
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Recursive page extractor (title, URLs, images) for an approved host.")
@@ -245,7 +386,10 @@ def main(argv=None):
     visited: Set[str] = set()
 
     print(f"[start] {args.start_url} (approved host: {approved_netloc}, depth: {args.depth})")
-    seen_hashes: Set[str] = set()
+    seen_hashes: Set[bytes] = set()
+    # start each run with empty URL caches (main may be called more than once from Python)
+    url_cleanup.cache_clear()
+    stay_on_site.cache_clear()
     crawl(args.start_url, approved_netloc, out_dir, args.depth, visited, seen_hashes)
     print(f"[done] Visited {len(visited)} page(s). Images saved under: {out_dir.resolve()}")
     return 0
@@ -9,6 +9,8 @@ import re
 import keyword
 import bisect
 import shutil
+import signal
+import select
 import json
 from pathlib import Path
 import tkinter as tk
@@ -17,9 +19,15 @@ import logging
 import tempfile
 import time
 import stat
+import io
+import codecs
+import locale
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 try:
-    from PIL import Image, ImageTk, ImageSequence  # optional for GIF
+    from PIL import Image, ImageTk  # optional for GIF
     PIL_AVAILABLE = True
 except Exception:
     PIL_AVAILABLE = False
@@ -29,6 +37,20 @@ APP_ROOT = Path(__file__).resolve().parent
 # Markers used to identify and later close terminals opened by this app
 WINDOW_MARKER = "Violent Python Showcase"
 CONTENT_MARKER = "[PYTHON SCRIPT RUNNING]"
+# Delay before a terminal-preference change is saved and the tools are re-scanned
+PREF_REFRESH_DELAY_MS = 150
+# Delay before a scheduled preferences save is written (further changes restart the wait)
+PREFS_SAVE_DELAY_MS = 300
+# Bytes read per os.read() call when streaming pip output into the Setup log
+PIPE_READ_SIZE = 65536
+# Decoded splash GIF frames kept in memory (frames are decoded on demand, least recently used dropped)
+GIF_FRAME_CACHE_SIZE = 32
+# Longest splash animation played, in frames; later frames of longer GIFs are ignored
+GIF_MAX_FRAMES = 240
+# Splash GIF frame delays: the per-frame duration from the file, with a default and a floor
+# (browsers treat very small GIF delays the same way)
+GIF_DEFAULT_FRAME_MS = 100
+GIF_MIN_FRAME_MS = 20
 
 # Basic logging (only configure if not already configured by caller)
 if not logging.getLogger().handlers:
@@ -36,30 +58,313 @@ if not logging.getLogger().handlers:
 logger = logging.getLogger("vp.splash")
 
 
+@lru_cache(maxsize=64)
+def _which(name: str):
+    # shutil.which walks PATH on every call; terminals rarely appear mid-session, so results are
+    # memoized. _clear_tool_caches() forces re-detection (Scan Tool Check, entering the Showcase).
+    return shutil.which(name)
+
+
+# Kitty on macOS is often only an app bundle (no `kitty` on PATH)
+KITTY_APP_PATHS = (
+    Path("/Applications/kitty.app"), Path("/Applications/Kitty.app"),
+    Path.home() / "Applications" / "kitty.app", Path.home() / "Applications" / "Kitty.app",
+)
+
+
+@lru_cache(maxsize=1)
+def _kitty_app_installed() -> bool:
+    # Four stat() calls per check; memoized alongside _which
+    return any(p.exists() for p in KITTY_APP_PATHS)
+
+
+# Showcase preview highlighting works in blocks of this many lines, tagging only the blocks
+# on screen (plus one either side) and never the same block twice
+HIGHLIGHT_BLOCK_LINES = 100
+# The preview shows at most this much of a script; lines longer than PREVIEW_LONG_LINE_CHARS
+# (minified or generated data) are shown but not highlighted
+PREVIEW_MAX_BYTES = 256 * 1024
+PREVIEW_LONG_LINE_CHARS = 10000
+# Previewed scripts kept with their computed highlight ranges (least recently used dropped)
+PREVIEW_CACHE_SIZE = 32
+# Delay after the last Showcase list selection change before its preview is loaded
+PREVIEW_SELECT_DELAY_MS = 120
+# Python syntax highlighting patterns, compiled once. Triple-quoted strings can span lines and
+# are matched over the whole file; the rest are (pattern, tag, group) matched within one block.
+PY_TRIPLE_STRING_RE = re.compile(r"('''.*?'''|\"\"\".*?\"\"\")", re.DOTALL)
+PY_HIGHLIGHT_PATTERNS = (
+    (re.compile(r"('([^'\\\n]|\\.)*'|\"([^\"\\\n]|\\.)*\")"), "py_string", 0),
+    (re.compile(r"#.*", re.MULTILINE), "py_comment", 0),
+    (re.compile(r"(?m)^\s*@\w+"), "py_decorator", 0),
+    # Keywords (whole words only)
+    (re.compile(r"\b(" + "|".join(re.escape(k) for k in keyword.kwlist) + r")\b"), "py_keyword", 0),
+    # Numbers (simple)
+    (re.compile(r"(?<![\w.])\d+(?:\.\d+)?"), "py_number", 0),
+    # def/class names
+    (re.compile(r"\bdef\s+(\w+)"), "py_defname", 1),
+    (re.compile(r"\bclass\s+(\w+)"), "py_classname", 1),
+)
+
+# Leading number of an assignment folder or file name (sort order in the Showcase list)
+LEADING_NUMBER_RE = re.compile(r"^(\d+)")
+
+# Showcase list labels: "03_pil_search_images" -> "PIL Search Images"
+LABEL_PREFIX_RE = re.compile(r"^(\d+)[-_](.+)$", re.IGNORECASE)
+LABEL_SEPARATORS_RE = re.compile(r"[_\-]+")
+# Words restored to upper case after title-casing
+LABEL_ACRONYMS = {
+    "api": "API",
+    "pil": "PIL",
+    "tcp": "TCP",
+    "udp": "UDP",
+    "pcap": "PCAP",
+    "http": "HTTP",
+    "https": "HTTPS",
+    "url": "URL",
+    "ip": "IP",
+    "dns": "DNS",
+    "ssl": "SSL",
+    "tls": "TLS",
+    "id3": "ID3",
+    "nltk": "NLTK",
+    "ml": "ML",
+    "oop": "OOP",
+    "exif": "EXIF",
+    "lsb": "LSB",
+    "mp3": "MP3",
+    "sha1": "SHA1",
+    "md5": "MD5",
+    "sha256": "SHA256",
+    "csv": "CSV",
+    "json": "JSON",
+}
+
+
+# Executables probed by the Setup page's tool check, per OS
+TOOL_PROBES = {
+    "macos": ("brew", "kitty", "wezterm", "alacritty"),
+    "windows": ("wt.exe", "wt", "winget", "kitty", "wezterm"),
+    "linux": ("kitty", "konsole", "gnome-terminal", "wezterm", "alacritty", "xterm"),
+}
+
+# Terminal emulators that can run a shell command, mapped to the argv prefix that runs
+# `bash -lc <command>` in a new window. Dict order is the fallback order.
+# Setup page (OS package installs):
+LINUX_SETUP_TERMINALS = {
+    "kitty": ("kitty", "--hold", "bash", "-lc"),
+    "alacritty": ("alacritty", "-e", "bash", "-lc"),
+    "wezterm": ("wezterm", "start", "--", "bash", "-lc"),
+    "gnome-terminal": ("gnome-terminal", "--window", "--", "bash", "-lc"),
+    "konsole": ("konsole", "--new-window", "-e", "bash", "-lc"),
+    "xterm": ("xterm", "-e", "bash", "-lc"),
+    "x-terminal-emulator": ("x-terminal-emulator", "-e", "bash", "-lc"),
+}
+# Showcase "Run in Terminal" (the preferred terminal is tried first)
+LINUX_SCRIPT_TERMINALS = {
+    "kitty": ("kitty", "--title", WINDOW_MARKER, "--hold", "bash", "-lc"),
+    "wezterm": ("wezterm", "start", "--", "bash", "-lc"),
+    "alacritty": ("alacritty", "--title", WINDOW_MARKER, "-e", "bash", "-lc"),
+    "gnome-terminal": ("gnome-terminal", "--window", "--", "bash", "-lc"),
+    "konsole": ("konsole", "--new-window", "-e", "bash", "-lc"),
+    "xterm": ("xterm", "-e", "bash", "-lc"),
+    "x-terminal-emulator": ("x-terminal-emulator", "-e", "bash", "-lc"),
+}
+MACOS_SCRIPT_TERMINALS = {
+    "kitty": ("kitty", "--title", WINDOW_MARKER, "--hold", "bash", "-lc"),
+    "wezterm": ("wezterm", "start", "--", "bash", "-lc"),
+    "alacritty": ("alacritty", "--title", WINDOW_MARKER, "-e", "bash", "-lc"),
+}
+
+
+def _prefetch_which(names):
+    # Warm the _which cache for all names at once: each lookup walks PATH with stat() calls,
+    # so running them on a few threads overlaps the waits instead of serializing them
+    with ThreadPoolExecutor(max_workers=min(8, len(names) or 1)) as pool:
+        list(pool.map(_which, names))
+
+
+def _offset_to_index(line_starts: list[int], pos: int, lo: int = 0, hi: int | None = None) -> str:
+    # Character offset in a text -> Tk "line.col" index, given the offsets where its lines start.
+    # lo/hi narrow the search to line_starts[lo:hi] when the caller knows where pos lies.
+    line_idx = bisect.bisect_right(line_starts, pos, lo, len(line_starts) if hi is None else hi) - 1
+    return f"{line_idx + 1}.{pos - line_starts[line_idx]}"
+
+
+@lru_cache(maxsize=512)
+def _friendly_label_for(name: str) -> str:
+    # Friendly Showcase title for a script file stem (pure, so memoized per stem)
+    m = LABEL_PREFIX_RE.match(name)
+    base = m.group(2) if m else name
+    base = LABEL_SEPARATORS_RE.sub(" ", base).strip()
+    base = base if base else name
+    # Title-case then restore acronyms
+    title = base.title()
+    return " ".join(LABEL_ACRONYMS.get(w.lower(), w) for w in title.split())
+
+
+def _wait_for_exit(procs: list, timeout: float) -> list:
+    # Wait up to timeout seconds for procs to exit and return those still running. Returns as
+    # soon as the last one exits instead of always sleeping for the full grace period.
+    deadline = time.monotonic() + timeout
+    alive = [p for p in procs if p.poll() is None]
+    if alive and hasattr(os, "pidfd_open"):
+        # Linux: a pidfd becomes readable when its process exits, so one poll() waits for all
+        fds = {}
+        try:
+            for p in alive:
+                fds[os.pidfd_open(p.pid)] = p
+            poller = select.poll()
+            for fd in fds:
+                poller.register(fd, select.POLLIN)
+            while fds:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in poller.poll(remaining * 1000):
+                    poller.unregister(fd)
+                    os.close(fd)
+                    fds.pop(fd).poll()
+        except OSError:
+            pass
+        finally:
+            for fd in fds:
+                os.close(fd)
+    else:
+        for p in alive:
+            try:
+                p.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                pass
+    return [p for p in alive if p.poll() is None]
+
+
+def _clear_tool_caches():
+    # Forget memoized tool lookups so terminals installed since the last check are found
+    _which.cache_clear()
+    _kitty_app_installed.cache_clear()
+
+
+def _safe_pack(widget, **pack_options):
+    # Pack widget unless it was destroyed or is already packed (avoids a no-op Tk round-trip)
+    if widget.winfo_exists() and not widget.winfo_manager():
+        widget.pack(**pack_options)
+
+
+def _safe_forget(widget):
+    # Unpack widget if it still exists and is currently packed
+    if widget.winfo_exists() and widget.winfo_manager():
+        widget.pack_forget()
+
+
+# Splash media candidates in order of preference: GIF (animated) first, then PNG fallbacks
+LOGO_CANDIDATES = (
+    APP_ROOT / "assets" / "logo.gif",
+    APP_ROOT / "assets" / "logo.png",
+    APP_ROOT / "assets" / "python-logo.png",
+)
+
+
+@lru_cache(maxsize=1)
 def find_logo_path():
-    # Prefer GIF (animated) if present; fall back to PNG
-    candidates = [
-        APP_ROOT / "assets" / "logo.gif",
-        APP_ROOT / "assets" / "logo.png",
-        APP_ROOT / "assets" / "python-logo.png",
-    ]
-    for p in candidates:
+    # Stat the candidates once per process; call find_logo_path.cache_clear() to look again
+    for p in LOGO_CANDIDATES:
         if p.exists():
             return p
     return None
 
 
-def find_image_logo_path():
-    # Only image-based fallbacks
-    candidates = [
-        APP_ROOT / "assets" / "logo.gif",
-        APP_ROOT / "assets" / "logo.png",
-        APP_ROOT / "assets" / "python-logo.png",
-    ]
-    for p in candidates:
-        if p.exists():
-            return p
-    return None
+# Default per-OS requirements files written by "Reset Requirements" (pre-encoded UTF-8)
+DEFAULT_REQUIREMENTS = {
+    "macos": (
+        b"# Violent-Python requirements (macOS)\n"
+        b"# Edit as needed, then click \"Install\" from the Setup page.\n"
+        b"# Lines beginning with '#' are comments and ignored by pip.\n"
+        b"# Non-comment lines are passed directly to pip as package requirements.\n\n"
+        b"# Terminal preference used by the GUI (editable):\n"
+        b"# vp:terminal=kitty\n"
+        b"# Options: kitty, wezterm, alacritty\n\n"
+        b"# Core assignment dependencies\n"
+        b"pillow\nprettytable\nrequests\nbeautifulsoup4\n"
+        b"# Add more packages below as needed for your environment:\n"
+        b"# rich\n# colorama\n# blake3\n# hyperscan\n# google-re2\n# selectolax\n# orjson\n"
+    ),
+    "linux": (
+        b"# Violent-Python requirements (Linux)\n"
+        b"# Edit as needed, then click \"Install\" from the Setup page.\n"
+        b"# Lines beginning with '#' are comments and ignored by pip.\n"
+        b"# Non-comment lines are passed directly to pip as package requirements.\n\n"
+        b"# Terminal preference used by the GUI (editable):\n"
+        b"# vp:terminal=kitty\n"
+        b"# Options: kitty, konsole, gnome-terminal, wezterm, alacritty\n\n"
+        b"# Core assignment dependencies\n"
+        b"pillow\nprettytable\nrequests\nbeautifulsoup4\n"
+        b"# Add more packages below as needed for your environment:\n"
+        b"# rich\n# colorama\n# blake3\n# hyperscan\n# google-re2\n# selectolax\n# orjson\n"
+    ),
+    "windows": (
+        b"# Violent-Python requirements (Windows)\n"
+        b"# Edit as needed, then click \"Install\" from the Setup page.\n"
+        b"# Lines beginning with '#' are comments and ignored by pip.\n"
+        b"# Non-comment lines are passed directly to pip as package requirements.\n\n"
+        b"# Terminal preference used by the GUI (editable):\n"
+        b"# vp:terminal=wt\n"
+        b"# Options: kitty, wt, wezterm\n\n"
+        b"# Core assignment dependencies\n"
+        b"pillow\nprettytable\nrequests\nbeautifulsoup4\n"
+        b"# Add more packages below as needed for your environment:\n"
+        b"# rich\n# colorama\n# blake3\n# google-re2\n# selectolax\n# orjson\n"
+    ),
+}
+DEFAULT_REQUIREMENTS_FALLBACK = b"# Edit as needed\n"
+
+# Commands run in a new terminal by "Install" to set up the preferred terminal. Only the package
+# names vary, so each is a constant filled in with str.format.
+
+# macOS: terminal preference -> (Homebrew cask, application name)
+MACOS_TERMINAL_CASKS = {
+    "kitty": ("kitty", "kitty"),
+    "wezterm": ("wezterm", "WezTerm"),
+    "alacritty": ("alacritty", "Alacritty"),
+}
+MACOS_SETUP_SH_TEMPLATE = (
+    "if command -v brew >/dev/null 2>&1; then "
+    "brew list --cask {cask} >/dev/null 2>&1 || brew install --cask {cask}; "
+    "open -a '{app}'; "
+    "else echo 'Homebrew not found. Install from https://brew.sh'; fi; "
+    "echo; echo 'If prompted by macOS, click Open to allow the terminal to run.'; "
+    "echo 'Press Enter to close'; read"
+)
+
+# Windows: terminal preference -> (winget package id, PowerShell that opens it once installed)
+WINDOWS_TERMINAL_PACKAGES = {
+    "kitty": ("Kitty.Kitty", "if (Get-Command kitty -ErrorAction SilentlyContinue) { Start-Process kitty -ArgumentList '--hold','powershell','-NoExit','-NoLogo','-Command','Write-Host ''Kitty initialized''; Read-Host ''Press Enter to close''' }"),
+    "wezterm": ("WezTerm.WezTerm", "if (Get-Command wezterm -ErrorAction SilentlyContinue) { Start-Process wezterm -ArgumentList 'start','--','powershell','-NoExit','-NoLogo','-Command','Write-Host ''WezTerm initialized''; Read-Host ''Press Enter to close''' }"),
+    "wt": ("Microsoft.WindowsTerminal", "if (Get-Command wt.exe -ErrorAction SilentlyContinue) { Start-Process wt -ArgumentList 'new-window','powershell','-NoExit','-NoLogo','-Command','Write-Host ''Windows Terminal initialized''; Read-Host ''Press Enter to close''' }"),
+}
+WINDOWS_SETUP_PS_TEMPLATE = (
+    "winget install --id {pkg} -e --accept-source-agreements --accept-package-agreements; "
+    "{post}; Write-Host ''; Read-Host 'Press Enter to close'"
+)
+
+# Linux: install {pkg} plus Tk with the available package manager (sudo may prompt), then
+# proactively open the terminal once if it is available
+LINUX_SETUP_SH_TEMPLATE = (
+    "if command -v apt-get >/dev/null 2>&1; then "
+    "sudo apt-get update && sudo apt-get install -y {pkg} python3-tk; "
+    "elif command -v dnf >/dev/null 2>&1; then "
+    "sudo dnf install -y {pkg} python3-tkinter; "
+    "elif command -v pacman >/dev/null 2>&1; then "
+    "sudo pacman -S --noconfirm {pkg} tk; "
+    "else echo 'No supported package manager found. Install your preferred terminal and Tk manually.'; fi; "
+    "if command -v {pkg} >/dev/null 2>&1; then "
+    "if [ '{pkg}' = 'kitty' ]; then kitty --hold bash -lc \"echo Initialized; read -p 'Installed: Kitty terminal. Press enter to close installation...'\"; "
+    "elif [ '{pkg}' = 'wezterm' ]; then wezterm start -- bash -lc \"echo Initialized; read -p 'Installed: Wezterm terminal. Press enter to close installation...'\"; "
+    "elif [ '{pkg}' = 'alacritty' ]; then alacritty -e bash -lc \"echo Initialized; read -p 'Installed: Alacritty terminal. Press enter to close installation...'\"; "
+    "elif [ '{pkg}' = 'gnome-terminal' ]; then gnome-terminal --window -- bash -lc \"echo Initialized; read -p 'Installed: GNOME terminal. Press enter to close installation...'\"; "
+    "elif [ '{pkg}' = 'konsole' ]; then konsole --new-window -e bash -lc \"echo Initialized; read -p 'Installed: konsole terminal. Press enter to close installation...'\"; "
+    "elif [ '{pkg}' = 'xterm' ]; then xterm -e bash -lc \"echo Initialized; read -p 'Installed: xterm terminal. Press enter to close installation...'\"; fi; fi; "
+    "echo; read -p 'Press Enter to close'"
+)
 
 
 class App(tk.Tk):
@@ -80,22 +385,38 @@ class App(tk.Tk):
             "linux_terminal_preference": "kitty",
             "windows_terminal_preference": "wt",
         }
+        # JSON of the preferences as last written to disk (save_prefs skips unchanged writes)
+        self._prefs_saved = None
+        # Pending after() id of a debounced save (see schedule_save_prefs)
+        self._prefs_save_after = None
         self._load_prefs()
 
         # Track external terminal processes launched by this app (kitty/wezterm/alacritty/wt/etc.)
         self.open_terms: list[subprocess.Popen] = []
+        # Terminals are also launched from worker threads; guard the list with a lock
+        self._open_terms_lock = threading.Lock()
 
+        # Frames are built on first use so the splash paints without waiting for the
+        # Setup/Showcase widgets; self.frames only holds the ones created so far
+        self._container = container
+        self._frame_classes = {F.__name__: F for F in (SplashFrame, SetupFrame, ShowcaseFrame)}
         self.frames = {}
-        for F in (SplashFrame, SetupFrame, ShowcaseFrame):
-            frame = F(parent=container, controller=self)
-            self.frames[F.__name__] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
 
+        self._current_frame = None
         self.show_frame("SplashFrame")
 
     def show_frame(self, name: str):
-        frame = self.frames[name]
+        frame = self.frames.get(name)
+        if frame is None:
+            frame = self._frame_classes[name](parent=self._container, controller=self)
+            self.frames[name] = frame
+            frame.grid(row=0, column=0, sticky="nsew")
         frame.tkraise()
+        # Let the frame that was covered stop any periodic work (e.g. the splash animation)
+        previous = self._current_frame
+        self._current_frame = frame
+        if previous is not None and previous is not frame and hasattr(previous, "on_hide"):
+            previous.on_hide()
         if hasattr(frame, "on_show"):
             frame.on_show()
 
@@ -106,7 +427,8 @@ class App(tk.Tk):
         try:
             p = self._prefs_path()
             if p.exists():
-                data = json.load(p.open("r", encoding="utf-8"))
+                # read_text closes the file right away (json.load(p.open()) left it to the GC)
+                data = json.loads(p.read_text(encoding="utf-8"))
                 if isinstance(data, dict):
                     for k in ("macos_terminal_preference", "linux_terminal_preference", "windows_terminal_preference"):
                         if k in data and isinstance(data[k], str):
@@ -120,10 +442,42 @@ class App(tk.Tk):
         except Exception:
             pass
 
+    def track_terminal(self, p: subprocess.Popen) -> None:
+        # Remember a launched terminal so Close All can stop it (safe from any thread)
+        with self._open_terms_lock:
+            self.open_terms.append(p)
+
+    def take_terminals(self) -> list[subprocess.Popen]:
+        # Hand over every tracked terminal and start a fresh list
+        with self._open_terms_lock:
+            terms, self.open_terms = self.open_terms, []
+        return terms
+
+    def schedule_save_prefs(self) -> None:
+        # Coalesce bursts of preference changes into one save once they settle
+        if self._prefs_save_after is not None:
+            self.after_cancel(self._prefs_save_after)
+        self._prefs_save_after = self.after(PREFS_SAVE_DELAY_MS, self.save_prefs)
+
     def save_prefs(self) -> None:
+        # Writing now supersedes any scheduled save
+        if self._prefs_save_after is not None:
+            try:
+                self.after_cancel(self._prefs_save_after)
+            except Exception:
+                pass
+            self._prefs_save_after = None
         try:
             p = self._prefs_path()
-            json.dump(self.preferences, p.open("w", encoding="utf-8"), indent=2)
+            data = json.dumps(self.preferences, indent=2)
+            # Skip the write when nothing changed since the last save (nested values included)
+            if data == self._prefs_saved and p.exists():
+                return
+            # Write a sibling temp file and swap it in, so a crash never leaves a truncated file
+            tmp = p.with_suffix(".json.tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, p)
+            self._prefs_saved = data
         except Exception:
             pass
 
@@ -149,6 +503,9 @@ class App(tk.Tk):
 
     def on_close(self):
         for frame in self.frames.values():
+            # on_hide stops timers and applies pending (debounced) changes before prefs are saved
+            if hasattr(frame, "on_hide"):
+                frame.on_hide()
             if hasattr(frame, "terminate_running_process"):
                 frame.terminate_running_process()
         try:
@@ -180,7 +537,10 @@ class SplashFrame(ttk.Frame):
         ttk.Button(buttons, text="Get Started", command=lambda: controller.show_frame("SetupFrame")).grid(row=0, column=0, padx=8)
         ttk.Button(buttons, text="Skip to Showcase", command=lambda: controller.show_frame("ShowcaseFrame")).grid(row=0, column=1, padx=8)
 
-        self._anim_frames = []
+        # Animated GIF state: the open PIL image, its frame count, and recently decoded frames
+        self._anim_pil = None
+        self._anim_count = 0
+        self._anim_cache: OrderedDict = OrderedDict()
         self._anim_index = 0
         self._anim_job = None
         self._load_logo()
@@ -197,21 +557,23 @@ class SplashFrame(ttk.Frame):
         if path.suffix.lower() == ".gif":
             if PIL_AVAILABLE:
                 try:
-                    im = Image.open(path)
-                    self._anim_frames = [ImageTk.PhotoImage(frame.convert("RGBA")) for frame in ImageSequence.Iterator(im)]
-                    if self._anim_frames:
-                        # Ensure label is visible
-                        if not self.logo_label.winfo_ismapped():
-                            self.logo_label.pack()
-                        logger.info(f"Splash: displaying GIF with {len(self._anim_frames)} frames: {path.name}")
-                        self._start_animation()
-                        return
+                    # Keep the GIF open and decode frames lazily instead of converting every frame up front
+                    self._anim_pil = Image.open(path)
+                    # Loop over at most GIF_MAX_FRAMES frames: an extremely long GIF is truncated
+                    # (a logo never is) so playback cannot walk an unbounded frame sequence
+                    self._anim_count = min(getattr(self._anim_pil, "n_frames", 1), GIF_MAX_FRAMES)
+                    self._anim_frame(0)  # decode the first frame now so a bad file falls back below
+                    # Ensure label is visible
+                    _safe_pack(self.logo_label)
+                    logger.info(f"Splash: displaying GIF with {self._anim_count} frames: {path.name}")
+                    self._start_animation()
+                    return
                 except Exception as e:
+                    self._stop_gif()
                     logger.warning(f"Splash: GIF load error {e}; trying tk.PhotoImage")
             try:
                 img = tk.PhotoImage(file=str(path))
-                if not self.logo_label.winfo_ismapped():
-                    self.logo_label.pack()
+                _safe_pack(self.logo_label)
                 self.logo_label.configure(image=img)
                 self.logo_label.image = img
                 logger.info(f"Splash: displaying GIF via tk.PhotoImage: {path.name}")
@@ -231,26 +593,68 @@ class SplashFrame(ttk.Frame):
             else:
                 photo = tk.PhotoImage(file=str(path))
                 logger.info(f"Splash: displaying image via tk.PhotoImage: {path.name}")
-            if not self.logo_label.winfo_ismapped():
-                self.logo_label.pack()
+            _safe_pack(self.logo_label)
             self.logo_label.configure(image=photo)
             self.logo_label.image = photo
         except Exception as e:
             logger.error(f"Splash: image load error {e}; path={path}")
             self.logo_label.config(text=str(path))
 
+    def _anim_frame(self, idx: int):
+        # Return (PhotoImage, delay in ms) for frame idx, decoding it on a cache miss
+        entry = self._anim_cache.get(idx)
+        if entry is not None:
+            self._anim_cache.move_to_end(idx)
+            return entry
+        self._anim_pil.seek(idx)
+        delay = max(GIF_MIN_FRAME_MS, int(self._anim_pil.info.get("duration") or GIF_DEFAULT_FRAME_MS))
+        entry = (ImageTk.PhotoImage(self._frame_for_tk(self._anim_pil)), delay)
+        self._anim_cache[idx] = entry
+        if len(self._anim_cache) > GIF_FRAME_CACHE_SIZE:
+            self._anim_cache.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _frame_for_tk(frame):
+        # Convert only when needed: RGB/RGBA frames (Pillow's later GIF frames) are used as-is,
+        # and opaque frames become RGB instead of RGBA (3 bytes per pixel instead of 4)
+        if frame.mode in ("RGB", "RGBA"):
+            return frame
+        need_alpha = "transparency" in frame.info or frame.mode in ("LA", "PA")
+        return frame.convert("RGBA" if need_alpha else "RGB")
+
+    def _stop_gif(self):
+        # Drop the animation state (used when a GIF cannot be decoded)
+        self._anim_count = 0
+        self._anim_cache.clear()
+        self._anim_pil = None
+
     def _start_animation(self):
-        if not self._anim_frames:
+        if not self._anim_count:
             return
-        self._anim_index = (self._anim_index + 1) % len(self._anim_frames)
-        self.logo_label.configure(image=self._anim_frames[self._anim_index])
-        self.logo_label.image = self._anim_frames[self._anim_index]
-        self._anim_job = self.after(100, self._start_animation)
+        self._anim_index = (self._anim_index + 1) % self._anim_count
+        try:
+            photo, delay = self._anim_frame(self._anim_index)
+        except Exception as e:
+            logger.warning(f"Splash: GIF frame {self._anim_index} decode error {e}; stopping animation")
+            self._stop_gif()
+            self._anim_job = None
+            return
+        self.logo_label.configure(image=photo)
+        self.logo_label.image = photo
+        # Show this frame for as long as the GIF asks
+        self._anim_job = self.after(delay, self._start_animation)
 
     def on_show(self):
-        if self._anim_frames and self._anim_job is None:
+        if self._anim_count and self._anim_job is None:
             self._start_animation()
 
+    def on_hide(self):
+        # Stop the after() chain while another frame is raised; on_show restarts it
+        if self._anim_job is not None:
+            self.after_cancel(self._anim_job)
+            self._anim_job = None
+
     def terminate_running_process(self):
         # Nothing to stop in Splash when showing static/animated images
         pass
@@ -263,6 +667,22 @@ class SetupFrame(ttk.Frame):
         self.proc = None
         self.q = queue.Queue()
         self._pump_job = None
+        # Launches the OS setup terminals (osascript/winget/emulator start-up can be slow) off the
+        # Tk thread; one worker keeps repeated clicks in order
+        self._launch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vp-launch")
+        # Run pip in its own process group/session so it (and any build subprocesses it starts)
+        # can be stopped together and does not receive the GUI's console signals
+        if os.name == "nt":
+            self._popen_group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            self._popen_group_kwargs = {"start_new_session": True}
+        # Debounced terminal-preference changes: pending after() job and os_name -> value to write
+        self._pending_refresh = None
+        self._pending_pref_writes: dict[str, str] = {}
+        # Background tool detection: results queue, running thread, and "re-scan when done" flag
+        self._tools_scan_q = queue.Queue()
+        self._tools_thread = None
+        self._tools_scan_stale = False
 
         # Danger style for uninstall (top-right)
         try:
@@ -315,7 +735,7 @@ class SetupFrame(ttk.Frame):
         # Second row for Scan Tool Check, aligned right
         self.tools_actions = ttk.Frame(self)
         self.tools_actions.pack(fill="x", padx=12, pady=(0, 6))
-        self.rescan_btn = ttk.Button(self.tools_actions, text="Scan Tool Check", command=self._update_os_tools_ui)
+        self.rescan_btn = ttk.Button(self.tools_actions, text="Scan Tool Check", command=self.rescan_tools)
         self.rescan_btn.pack(side="right")
 
         self.status = ttk.Label(self, text="Select your OS to view and install requirements.")
@@ -330,7 +750,7 @@ class SetupFrame(ttk.Frame):
         # OS tools detection summary (colored ✓/✗)
         tools_frame = ttk.Frame(self)
         tools_frame.pack(fill="x", padx=12, pady=(0, 6))
-        self.tools_text = tk.Text(tools_frame, height=6, wrap="word")
+        self.tools_text = tk.Text(tools_frame, height=6, wrap="word", undo=False)
         self.tools_text.tag_configure("ok", foreground="#22863a")   # green
         self.tools_text.tag_configure("bad", foreground="#d73a49")  # red
         self.tools_text.configure(state="disabled")
@@ -339,32 +759,20 @@ class SetupFrame(ttk.Frame):
         # macOS preferred terminal selection (shown only when MacOS is selected)
         self.pref_row = ttk.Frame(self)
         ttk.Label(self.pref_row, text="Preferred macOS terminal:").pack(side="left")
-        self.macos_pref_var = tk.StringVar(value=getattr(self.controller, "preferences", {}).get("macos_terminal_preference", "kitty"))
+        self.macos_pref_var = tk.StringVar(value=self.controller.preferences.get("macos_terminal_preference", "kitty"))
         self.macos_pref_combo = ttk.Combobox(self.pref_row, state="readonly", values=["Kitty", "WezTerm", "Alacritty"], width=12)
         # Map internal values to labels and back
         label_map = {"kitty": "Kitty", "wezterm": "WezTerm", "alacritty": "Alacritty"}
         inv_label_map = {v: k for k, v in label_map.items()}
         self.macos_pref_combo.set(label_map.get(self.macos_pref_var.get(), "Kitty"))
-        def on_pref_change(_evt=None):
-            choice = inv_label_map.get(self.macos_pref_combo.get(), "kitty")
-            self.macos_pref_var.set(choice)
-            self.controller.preferences["macos_terminal_preference"] = choice
-            try:
-                self.controller.save_prefs()
-            except Exception:
-                pass
-            try:
-                self._write_terminal_pref_to_requirements("macos", choice)
-            except Exception:
-                pass
-            self._update_os_tools_ui()
-        self.macos_pref_combo.bind("<<ComboboxSelected>>", on_pref_change)
+        self.macos_pref_combo.bind("<<ComboboxSelected>>", partial(
+            self._on_pref_change, "macos", self.macos_pref_combo, inv_label_map, self.macos_pref_var, "kitty"))
         self.macos_pref_combo.pack(side="left", padx=8)
 
         # Linux preferred terminal selection (shown only when Linux is selected)
         self.linux_pref_row = ttk.Frame(self)
         ttk.Label(self.linux_pref_row, text="Preferred Linux terminal:").pack(side="left")
-        self.linux_pref_var = tk.StringVar(value=getattr(self.controller, "preferences", {}).get("linux_terminal_preference", "kitty"))
+        self.linux_pref_var = tk.StringVar(value=self.controller.preferences.get("linux_terminal_preference", "kitty"))
         # Display labels
         linux_values = ["Kitty", "WezTerm", "Alacritty", "GNOME Terminal", "Konsole", "Xterm"]
         self.linux_pref_combo = ttk.Combobox(self.linux_pref_row, state="readonly", values=linux_values, width=16)
@@ -378,45 +786,21 @@ class SetupFrame(ttk.Frame):
         }
         linux_inv_map = {v: k for k, v in linux_label_map.items()}
         self.linux_pref_combo.set(linux_label_map.get(self.linux_pref_var.get(), "Kitty"))
-        def on_linux_pref_change(_evt=None):
-            choice = linux_inv_map.get(self.linux_pref_combo.get(), "kitty")
-            self.linux_pref_var.set(choice)
-            self.controller.preferences["linux_terminal_preference"] = choice
-            try:
-                self.controller.save_prefs()
-            except Exception:
-                pass
-            try:
-                self._write_terminal_pref_to_requirements("linux", choice)
-            except Exception:
-                pass
-            self._update_os_tools_ui()
-        self.linux_pref_combo.bind("<<ComboboxSelected>>", on_linux_pref_change)
+        self.linux_pref_combo.bind("<<ComboboxSelected>>", partial(
+            self._on_pref_change, "linux", self.linux_pref_combo, linux_inv_map, self.linux_pref_var, "kitty"))
         self.linux_pref_combo.pack(side="left", padx=8)
 
         # Windows preferred terminal selection (shown only when Windows is selected)
         self.win_pref_row = ttk.Frame(self)
         ttk.Label(self.win_pref_row, text="Preferred Windows terminal:").pack(side="left")
-        self.win_pref_var = tk.StringVar(value=getattr(self.controller, "preferences", {}).get("windows_terminal_preference", "wt"))
+        self.win_pref_var = tk.StringVar(value=self.controller.preferences.get("windows_terminal_preference", "wt"))
         win_values = ["Windows Terminal", "Kitty", "WezTerm"]
         self.win_pref_combo = ttk.Combobox(self.win_pref_row, state="readonly", values=win_values, width=18)
         win_label_map = {"wt": "Windows Terminal", "kitty": "Kitty", "wezterm": "WezTerm"}
         win_inv_map = {v: k for k, v in win_label_map.items()}
         self.win_pref_combo.set(win_label_map.get(self.win_pref_var.get(), "Windows Terminal"))
-        def on_win_pref_change(_evt=None):
-            choice = win_inv_map.get(self.win_pref_combo.get(), "wt")
-            self.win_pref_var.set(choice)
-            self.controller.preferences["windows_terminal_preference"] = choice
-            try:
-                self.controller.save_prefs()
-            except Exception:
-                pass
-            try:
-                self._write_terminal_pref_to_requirements("windows", choice)
-            except Exception:
-                pass
-            self._update_os_tools_ui()
-        self.win_pref_combo.bind("<<ComboboxSelected>>", on_win_pref_change)
+        self.win_pref_combo.bind("<<ComboboxSelected>>", partial(
+            self._on_pref_change, "windows", self.win_pref_combo, win_inv_map, self.win_pref_var, "wt"))
         self.win_pref_combo.pack(side="left", padx=8)
 
         # Help labels for per-OS preferences (packed when OS is selected)
@@ -436,12 +820,32 @@ class SetupFrame(ttk.Frame):
             foreground="#666",
         )
 
-        # Regex for parsing vp:terminal metadata in requirements files
-        self._vp_terminal_re = re.compile(r"^\s*#\s*vp:terminal\s*=\s*([\w\-]+)\s*$", re.IGNORECASE)
+        # Per-OS preference row and help label, shown only while that OS is selected
+        self._os_widgets = {
+            "macos": (self.pref_row, self.macos_pref_help),
+            "linux": (self.linux_pref_row, self.linux_pref_help),
+            "windows": (self.win_pref_row, self.win_pref_help),
+        }
+
+        # Regex for parsing vp:terminal metadata in requirements files. MULTILINE lets one search()
+        # scan a whole file; [^\S\n] (whitespace other than newline) keeps each match on one line.
+        self._vp_terminal_re = re.compile(
+            r"^[^\S\n]*#[^\S\n]*vp:terminal[^\S\n]*=[^\S\n]*([\w\-]+)[^\S\n]*$",
+            re.IGNORECASE | re.MULTILINE,
+        )
+        # Same pattern over raw bytes, for rewriting the metadata line without decoding the file
+        self._vp_terminal_re_bytes = re.compile(
+            self._vp_terminal_re.pattern.encode("ascii"),
+            re.IGNORECASE | re.MULTILINE,
+        )
+        # Parsed requirements files: path -> ((st_mtime_ns, st_size), text, vp:terminal value)
+        self._req_cache: dict[Path, tuple[tuple[int, int], str | None, str | None]] = {}
 
         text_frame = ttk.Frame(self)
         text_frame.pack(fill="both", expand=True, padx=12, pady=(0, 12))
-        self.output = tk.Text(text_frame, height=20, wrap="word")
+        # Read-only views whose contents are replaced wholesale: never record undo history
+        # (set explicitly so an option-database default such as *Text.undo cannot turn it on)
+        self.output = tk.Text(text_frame, height=20, wrap="word", undo=False)
         yscroll = ttk.Scrollbar(text_frame, orient="vertical", command=self.output.yview)
         self.output.configure(yscrollcommand=yscroll.set)
         self.output.pack(side="left", fill="both", expand=True)
@@ -458,17 +862,61 @@ class SetupFrame(ttk.Frame):
             else:
                 self.choose_os("linux")
 
+    def on_hide(self):
+        self._flush_pref_refresh()
+
+    def _on_pref_change(self, os_name: str, combo, inv_map: dict, var, default: str, _evt=None):
+        # Shared <<ComboboxSelected>> handler for the per-OS terminal preference rows
+        choice = inv_map.get(combo.get(), default)
+        var.set(choice)
+        self.controller.preferences[f"{os_name}_terminal_preference"] = choice
+        self._schedule_pref_refresh(os_name, choice)
+
+    def _schedule_pref_refresh(self, os_name: str, value: str):
+        # Coalesce rapid combobox changes: save prefs, rewrite the requirements file and
+        # re-scan tools once, after the selection has settled
+        self._pending_pref_writes[os_name] = value
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(PREF_REFRESH_DELAY_MS, self._do_pref_refresh)
+
+    def _do_pref_refresh(self):
+        self._pending_refresh = None
+        pending, self._pending_pref_writes = self._pending_pref_writes, {}
+        try:
+            self.controller.save_prefs()
+        except Exception:
+            pass
+        for os_name, value in pending.items():
+            try:
+                self._write_terminal_pref_to_requirements(os_name, value)
+            except Exception:
+                pass
+        self._update_os_tools_ui()
+
+    def _flush_pref_refresh(self) -> bool:
+        # Apply a pending change now (before re-reading requirements files or closing).
+        # Returns True if a refresh ran (it already started a tool scan)
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+            self._do_pref_refresh()
+            return True
+        return False
+
     def _append_log(self, text):
         self.output.insert("end", text)
         self.output.see("end")
 
     def _pump(self):
+        # Drain everything queued since the last tick, then insert it with one Text update
+        pending = []
         try:
             while True:
-                line = self.q.get_nowait()
-                self._append_log(line)
+                pending.append(self.q.get_nowait())
         except queue.Empty:
             pass
+        if pending:
+            self._append_log("".join(pending))
         if self.proc and self.proc.poll() is None:
             self._pump_job = self.after(50, self._pump)
         else:
@@ -491,11 +939,6 @@ class SetupFrame(ttk.Frame):
 
     def choose_os(self, name: str):
         self.selected_os = name
-        # Sync preference from the selected OS requirements file (vp:terminal=...)
-        try:
-            self._sync_pref_from_requirements()
-        except Exception:
-            pass
         # Update button styles (simple visual feedback)
         for btn in (self.btn_linux, self.btn_macos, self.btn_windows):
             btn.state(["!pressed"])  # reset
@@ -512,128 +955,39 @@ class SetupFrame(ttk.Frame):
             self.reset_req_btn.config(state="normal")
         except Exception:
             pass
-        # Update OS tools detection and Install button availability
-        self._update_os_tools_ui()
-        # Show preview of requirements file
+        # Show preview of requirements file; this also syncs the preference from its
+        # vp:terminal line and refreshes OS tools detection / Install button availability
         self.show_requirements_preview()
-        # Show/hide macOS and Linux pref rows, and ensure actions appear after them
+        # Show the selected OS's pref row + help label and hide the others; widgets already in
+        # the wanted state are left alone (no geometry-manager round-trip).
         # Temporarily remove actions row to control order
-        try:
-            self.actions.pack_forget()
-        except Exception:
-            pass
-        if name == "macos":
-            try:
-                self.pref_row.pack(fill="x", padx=12, pady=(0, 8))
-            except Exception:
-                pass
-            try:
-                self.linux_pref_row.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_row.pack_forget()
-            except Exception:
-                pass
-            # Pack help under macOS preference
-            try:
-                self.linux_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.macos_pref_help.pack(anchor="w", padx=12, pady=(2, 10))
-            except Exception:
-                pass
-        elif name == "linux":
-            try:
-                self.linux_pref_row.pack(fill="x", padx=12, pady=(0, 8))
-            except Exception:
-                pass
-            try:
-                self.pref_row.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_row.pack_forget()
-            except Exception:
-                pass
-            # Pack help under Linux preference
-            try:
-                self.macos_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.linux_pref_help.pack(anchor="w", padx=12, pady=(2, 10))
-            except Exception:
-                pass
-        elif name == "windows":
-            try:
-                self.win_pref_row.pack(fill="x", padx=12, pady=(0, 8))
-            except Exception:
-                pass
-            try:
-                self.pref_row.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.linux_pref_row.pack_forget()
-            except Exception:
-                pass
-            # Pack help under Windows preference
-            try:
-                self.macos_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.linux_pref_help.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_help.pack(anchor="w", padx=12, pady=(2, 10))
-            except Exception:
-                pass
-        else:
-            try:
-                self.pref_row.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.linux_pref_row.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.win_pref_row.pack_forget()
-            except Exception:
-                pass
-            # Hide all help labels
-            for lbl in (self.macos_pref_help, self.linux_pref_help, self.win_pref_help):
-                try:
-                    lbl.pack_forget()
-                except Exception:
-                    pass
+        _safe_forget(self.actions)
+        for os_name, (row, help_label) in self._os_widgets.items():
+            if os_name != name:
+                _safe_forget(row)
+                _safe_forget(help_label)
+        selected = self._os_widgets.get(name)
+        if selected is not None:
+            row, help_label = selected
+            _safe_pack(row, fill="x", padx=12, pady=(0, 8))
+            _safe_pack(help_label, anchor="w", padx=12, pady=(2, 10))
         # Re-pack actions after pref rows so Install appears below the Preferred Terminal row
-        try:
-            self.actions.pack(fill="x", padx=12, pady=(0, 8))
-        except Exception:
-            pass
+        _safe_pack(self.actions, fill="x", padx=12, pady=(0, 8))
 
     def show_requirements_preview(self):
         req = self.get_selected_requirements_file()
-        # Re-sync preference from file before showing
+        # A debounced combobox change must reach the file before it is read back
+        refreshed = self._flush_pref_refresh()
         try:
-            self._sync_pref_from_requirements()
-        except Exception:
-            pass
-        try:
-            content = req.read_text(encoding="utf-8") if req.exists() else "(No file found)"
+            # One cached read feeds both the preference sync and the preview
+            text, terminal = self._read_req_cached(req)
+            try:
+                self._apply_terminal_pref(terminal)
+            except Exception:
+                pass
+            content = text if text is not None else f"[Error reading {req.name}]\nFile is not valid UTF-8"
+        except FileNotFoundError:
+            content = "(No file found)"
         except Exception as e:
             content = f"[Error reading {req.name}]\n{e}"
         self.output.configure(state="normal")
@@ -641,8 +995,10 @@ class SetupFrame(ttk.Frame):
         self.output.insert("1.0", content)
         self.output.configure(state="disabled")
         self.status.config(text=f"Selected {self.selected_os.upper()} — showing {req.name}")
-        # Also refresh tools UI (in case user edited the file or installed tools)
-        self._update_os_tools_ui()
+        # Also refresh tools UI (in case user edited the file or installed tools), unless the
+        # flushed refresh above just started that scan
+        if not refreshed:
+            self._update_os_tools_ui()
         # Ensure open requirements enabled when OS selected
         self.open_req_btn.config(state=("normal" if self.selected_os else "disabled"))
 
@@ -677,12 +1033,28 @@ class SetupFrame(ttk.Frame):
                     cwd=str(APP_ROOT),
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
+                    bufsize=0,
+                    **self._popen_group_kwargs,
                 )
                 assert self.proc.stdout is not None
-                for line in self.proc.stdout:
-                    self.q.put(line)
+                # Read the pipe in large raw chunks instead of line by line. The incremental
+                # decoder keeps characters and \r\n pairs split across chunks intact and
+                # translates newlines the same way text mode did.
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace"),
+                    translate=True,
+                )
+                fd = self.proc.stdout.fileno()
+                while True:
+                    chunk = os.read(fd, PIPE_READ_SIZE)
+                    if not chunk:
+                        break
+                    text = decoder.decode(chunk)
+                    if text:
+                        self.q.put(text)
+                text = decoder.decode(b"", final=True)
+                if text:
+                    self.q.put(text)
             except Exception as e:
                 self.q.put(f"[Error] {e}\n")
 
@@ -690,20 +1062,26 @@ class SetupFrame(ttk.Frame):
         self._pump()
 
     # --- Requirements metadata helpers ---
-    def _sync_pref_from_requirements(self):
-        req = self.get_selected_requirements_file()
-        if not req.exists():
-            return
+    def _read_req_cached(self, req: Path):
+        # Returns (text, vp:terminal value) for a requirements file, re-reading it only when its
+        # mtime or size changed. text is None if the file is not valid UTF-8; OSError propagates.
+        st = req.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._req_cache.get(req)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        data = req.read_bytes()
         try:
-            text = req.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except Exception:
-            return
-        found = None
-        for line in text:
-            m = self._vp_terminal_re.match(line)
-            if m:
-                found = m.group(1).strip().lower()
-                break
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+        m = self._vp_terminal_re.search(data.decode("utf-8", errors="ignore"))
+        found = m.group(1).strip().lower() if m else None
+        self._req_cache[req] = (key, text, found)
+        return text, found
+
+    def _apply_terminal_pref(self, found):
+        # Apply a vp:terminal value read from the selected OS requirements file
         if not found:
             return
         # Apply to preferences and UI depending on OS
@@ -737,10 +1115,7 @@ class SetupFrame(ttk.Frame):
                 self.win_pref_combo.set(label)
             except Exception:
                 pass
-        try:
-            self.controller.save_prefs()
-        except Exception:
-            pass
+        self.controller.schedule_save_prefs()
 
     def _write_terminal_pref_to_requirements(self, os_name: str, value: str):
         # Resolve file based on OS name
@@ -749,68 +1124,31 @@ class SetupFrame(ttk.Frame):
         req = self.get_selected_requirements_file()
         self.selected_os = prev
         try:
+            # Work on raw bytes: no decode/encode pass, and bytes that are not valid UTF-8
+            # survive the rewrite. The file is regenerable (Reset OS file), so it is written
+            # in one buffered write with no fsync.
+            line = f"# vp:terminal={value}".encode("utf-8")
             if not req.exists():
-                req.write_text(f"# vp:terminal={value}\n", encoding="utf-8")
+                req.write_bytes(line + b"\n")
                 return
-            text = req.read_text(encoding="utf-8", errors="ignore").splitlines()
-            wrote = False
-            for i, line in enumerate(text):
-                if self._vp_terminal_re.match(line):
-                    text[i] = f"# vp:terminal={value}"
-                    wrote = True
-                    break
-            if not wrote:
+            data = req.read_bytes()
+            # One MULTILINE sweep replaces the first metadata line in place
+            new_data, n = self._vp_terminal_re_bytes.subn(lambda _m: line, data, count=1)
+            if n == 0:
                 # Prepend metadata line at top to keep it visible
-                text = [f"# vp:terminal={value}"] + text
-            req.write_text("\n".join(text) + "\n", encoding="utf-8")
+                new_data = line + b"\n" + data
+            # Skip the write entirely when the file already holds this value
+            if new_data != data:
+                req.write_bytes(new_data)
         except Exception:
             # Silently ignore write failures to avoid blocking UI
             pass
+        finally:
+            # Drop the cached parse even if the mtime/size did not visibly change
+            self._req_cache.pop(req, None)
 
     def _default_requirements_content(self, os_name: str) -> str:
-        if os_name == "macos":
-            return (
-                "# Violent-Python requirements (macOS)\n"
-                "# Edit as needed, then click \"Install\" from the Setup page.\n"
-                "# Lines beginning with '#' are comments and ignored by pip.\n"
-                "# Non-comment lines are passed directly to pip as package requirements.\n\n"
-                "# Terminal preference used by the GUI (editable):\n"
-                "# vp:terminal=kitty\n"
-                "# Options: kitty, wezterm, alacritty\n\n"
-                "# Core assignment dependencies\n"
-                "pillow\nprettytable\nrequests\nbeautifulsoup4\n"
-                "# Add more packages below as needed for your environment:\n"
-                "# rich\n# colorama\n"
-            )
-        if os_name == "linux":
-            return (
-                "# Violent-Python requirements (Linux)\n"
-                "# Edit as needed, then click \"Install\" from the Setup page.\n"
-                "# Lines beginning with '#' are comments and ignored by pip.\n"
-                "# Non-comment lines are passed directly to pip as package requirements.\n\n"
-                "# Terminal preference used by the GUI (editable):\n"
-                "# vp:terminal=kitty\n"
-                "# Options: kitty, konsole, gnome-terminal, wezterm, alacritty\n\n"
-                "# Core assignment dependencies\n"
-                "pillow\nprettytable\nrequests\nbeautifulsoup4\n"
-                "# Add more packages below as needed for your environment:\n"
-                "# rich\n# colorama\n"
-            )
-        if os_name == "windows":
-            return (
-                "# Violent-Python requirements (Windows)\n"
-                "# Edit as needed, then click \"Install\" from the Setup page.\n"
-                "# Lines beginning with '#' are comments and ignored by pip.\n"
-                "# Non-comment lines are passed directly to pip as package requirements.\n\n"
-                "# Terminal preference used by the GUI (editable):\n"
-                "# vp:terminal=wt\n"
-                "# Options: kitty, wt, wezterm\n\n"
-                "# Core assignment dependencies\n"
-                "pillow\nprettytable\nrequests\nbeautifulsoup4\n"
-                "# Add more packages below as needed for your environment:\n"
-                "# rich\n# colorama\n"
-            )
-        return "# Edit as needed\n"
+        return DEFAULT_REQUIREMENTS.get(os_name, DEFAULT_REQUIREMENTS_FALLBACK).decode("utf-8")
 
     def reset_requirements_to_defaults(self):
         if not self.selected_os:
@@ -818,9 +1156,9 @@ class SetupFrame(ttk.Frame):
             return
         os_name = self.selected_os
         req = self.get_selected_requirements_file()
-        tpl = self._default_requirements_content(os_name)
         try:
-            req.write_text(tpl, encoding="utf-8")
+            req.write_bytes(DEFAULT_REQUIREMENTS.get(os_name, DEFAULT_REQUIREMENTS_FALLBACK))
+            self._req_cache.pop(req, None)
             self.status.config(text=f"Reset {req.name} to defaults.")
             self.show_requirements_preview()
         except Exception as e:
@@ -830,95 +1168,44 @@ class SetupFrame(ttk.Frame):
 
     def install_os_packages(self):
         # Always run both: OS package setup (terminal + Tk) and pip install for the selected OS file.
+        prefs = self.controller.preferences
         if self.selected_os == "macos":
             # Install the preferred terminal via Homebrew in a new terminal window
-            pref = getattr(self.controller, "preferences", {}).get("macos_terminal_preference", "kitty")
-            if pref == "kitty":
-                install_line = "brew list --cask kitty >/dev/null 2>&1 || brew install --cask kitty; "
-                launch_line = "open -a 'kitty'; "
-            elif pref == "wezterm":
-                install_line = "brew list --cask wezterm >/dev/null 2>&1 || brew install --cask wezterm; "
-                launch_line = "open -a 'WezTerm'; "
-            elif pref == "alacritty":
-                install_line = "brew list --cask alacritty >/dev/null 2>&1 || brew install --cask alacritty; "
-                launch_line = "open -a 'Alacritty'; "
-            else:
-                # Fallback to kitty
-                install_line = "brew list --cask kitty >/dev/null 2>&1 || brew install --cask kitty; "
-                launch_line = "open -a 'kitty'; "
-            cmd = (
-                "if command -v brew >/dev/null 2>&1; then "
-                f"{install_line}{launch_line}"
-                "else echo 'Homebrew not found. Install from https://brew.sh'; fi; "
-                "echo; echo 'If prompted by macOS, click Open to allow the terminal to run.'; "
-                "echo 'Press Enter to close'; read"
-            )
-            self._run_os_cmd_in_terminal(cmd)
+            pref = prefs.get("macos_terminal_preference", "kitty")
+            # Unknown values fall back to kitty
+            cask, app = MACOS_TERMINAL_CASKS.get(pref, MACOS_TERMINAL_CASKS["kitty"])
+            cmd = MACOS_SETUP_SH_TEMPLATE.format(cask=cask, app=app)
+            self._watch_launch(self._launch_pool.submit(self._run_os_cmd_in_terminal, cmd))
             # One-time reminder in UI (persisted)
-            flags = self.controller.preferences.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
+            flags = prefs.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
             if not flags.get("macos", False):
                 term_label = {"kitty": "Kitty", "wezterm": "WezTerm", "alacritty": "Alacritty"}.get(pref, pref)
                 self.status.config(text=f"We launched {term_label} to complete first-run permissions. If terminal didn't open automatically try opening manually before attempting re-installing.")
                 flags["macos"] = True
-                try:
-                    self.controller.save_prefs()
-                except Exception:
-                    pass
+                self.controller.schedule_save_prefs()
             # Also install pip requirements for the selected OS
             self.install_pip_for_selected()
         elif self.selected_os == "windows":
             # Install the preferred terminal via winget in a new window
-            wpref = getattr(self.controller, "preferences", {}).get("windows_terminal_preference", "wt")
-            if wpref == "kitty":
-                pkg = "Kitty.Kitty"
-                post = "if (Get-Command kitty -ErrorAction SilentlyContinue) { Start-Process kitty -ArgumentList '--hold','powershell','-NoExit','-NoLogo','-Command','Write-Host ''Kitty initialized''; Read-Host ''Press Enter to close''' }";
-            elif wpref == "wezterm":
-                pkg = "WezTerm.WezTerm"
-                post = "if (Get-Command wezterm -ErrorAction SilentlyContinue) { Start-Process wezterm -ArgumentList 'start','--','powershell','-NoExit','-NoLogo','-Command','Write-Host ''WezTerm initialized''; Read-Host ''Press Enter to close''' }";
-            else:
-                pkg = "Microsoft.WindowsTerminal"
-                post = "if (Get-Command wt.exe -ErrorAction SilentlyContinue) { Start-Process wt -ArgumentList 'new-window','powershell','-NoExit','-NoLogo','-Command','Write-Host ''Windows Terminal initialized''; Read-Host ''Press Enter to close''' }";
-            ps_cmd = (
-                f"winget install --id {pkg} -e --accept-source-agreements --accept-package-agreements; "
-                + post + "; Write-Host ''; Read-Host 'Press Enter to close'"
-            )
-            self._run_os_cmd_in_terminal(ps_cmd)
-            flags = self.controller.preferences.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
+            wpref = prefs.get("windows_terminal_preference", "wt")
+            pkg, post = WINDOWS_TERMINAL_PACKAGES.get(wpref, WINDOWS_TERMINAL_PACKAGES["wt"])
+            ps_cmd = WINDOWS_SETUP_PS_TEMPLATE.format(pkg=pkg, post=post)
+            self._watch_launch(self._launch_pool.submit(self._run_os_cmd_in_terminal, ps_cmd))
+            flags = prefs.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
             if not flags.get("windows", False):
                 shown = {"wt": "Windows Terminal", "kitty": "Kitty", "wezterm": "WezTerm"}.get(wpref, "Windows Terminal")
                 self.status.config(text=f"We launched {shown} to complete first-run initialization. If terminal didn't open automatically try opening manually before attempting re-installing.")
                 flags["windows"] = True
-                try:
-                    self.controller.save_prefs()
-                except Exception:
-                    pass
+                self.controller.schedule_save_prefs()
             # Also install pip requirements for the selected OS
             self.install_pip_for_selected()
         elif self.selected_os == "linux":
             # Try to install the preferred terminal via the available package manager (sudo may prompt)
-            pref = getattr(self.controller, "preferences", {}).get("linux_terminal_preference", "kitty")
-            # Map preferred to package name (generally the same) and add Tk package per distro
-            pkg = pref
-            sh = (
-                "if command -v apt-get >/dev/null 2>&1; then "
-                f"sudo apt-get update && sudo apt-get install -y {pkg} python3-tk; "
-                "elif command -v dnf >/dev/null 2>&1; then "
-                f"sudo dnf install -y {pkg} python3-tkinter; "
-                "elif command -v pacman >/dev/null 2>&1; then "
-                f"sudo pacman -S --noconfirm {pkg} tk; "
-                "else echo 'No supported package manager found. Install your preferred terminal and Tk manually.'; fi; "
-                # Proactively open the preferred terminal once if available
-                f"if command -v {pkg} >/dev/null 2>&1; then "
-                f"if [ '{pkg}' = 'kitty' ]; then kitty --hold bash -lc \"echo Initialized; read -p 'Installed: Kitty terminal. Press enter to close installation...'\"; "
-                f"elif [ '{pkg}' = 'wezterm' ]; then wezterm start -- bash -lc \"echo Initialized; read -p 'Installed: Wezterm terminal. Press enter to close installation...'\"; "
-                f"elif [ '{pkg}' = 'alacritty' ]; then alacritty -e bash -lc \"echo Initialized; read -p 'Installed: Alacritty terminal. Press enter to close installation...'\"; "
-                f"elif [ '{pkg}' = 'gnome-terminal' ]; then gnome-terminal --window -- bash -lc \"echo Initialized; read -p 'Installed: GNOME terminal. Press enter to close installation...'\"; "
-                f"elif [ '{pkg}' = 'konsole' ]; then konsole --new-window -e bash -lc \"echo Initialized; read -p 'Installed: konsole terminal. Press enter to close installation...'\"; "
-                f"elif [ '{pkg}' = 'xterm' ]; then xterm -e bash -lc \"echo Initialized; read -p 'Installed: xterm terminal. Press enter to close installation...'\"; fi; fi; "
-                "echo; read -p 'Press Enter to close'"
-            )
-            self._run_os_cmd_in_terminal(sh)
-            flags = self.controller.preferences.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
+            pref = prefs.get("linux_terminal_preference", "kitty")
+            # The package name is generally the same as the preference; Tk is added per distro
+            sh = LINUX_SETUP_SH_TEMPLATE.format(pkg=pref)
+            self._watch_launch(self._launch_pool.submit(self._run_os_cmd_in_terminal, sh))
+            flags = prefs.setdefault("first_run_notice", {"macos": False, "windows": False, "linux": False})
             if not flags.get("linux", False):
                 pretty = {
                     "kitty": "Kitty", "wezterm": "WezTerm", "alacritty": "Alacritty",
@@ -926,23 +1213,39 @@ class SetupFrame(ttk.Frame):
                 }.get(pref, pref)
                 self.status.config(text=f"We launched {pretty} to complete first-run initialization. If terminal didn't open automatically try opening manually before attempting re-installing.")
                 flags["linux"] = True
-                try:
-                    self.controller.save_prefs()
-                except Exception:
-                    pass
+                self.controller.schedule_save_prefs()
             # Also install pip requirements for the selected OS
             self.install_pip_for_selected()
         else:
             messagebox.showinfo("Install OS packages", "Select an OS first.")
+            return
+        # The installer runs in its own terminal window and finishes whenever the user is done
+        # there, so tool caches are not cleared here; Scan Tool Check and entering the
+        # Showcase re-detect them
 
     # Cross-platform: open a new terminal window and run the given command string
     def _run_os_cmd_in_terminal(self, cmd: str):
-        if sys.platform.startswith("darwin"):
-            self._macos_run_in_terminal(cmd)
-        elif os.name == "nt":
-            self._windows_run_in_terminal(cmd)
-        else:
-            self._linux_run_in_terminal(cmd)
+        # Runs on the launch worker thread: no Tk calls here. Returns an error message for
+        # _watch_launch to show, or None once a terminal was started
+        try:
+            if sys.platform.startswith("darwin"):
+                self._macos_run_in_terminal(cmd)
+            elif os.name == "nt":
+                self._windows_run_in_terminal(cmd)
+            elif not self._linux_spawn_terminal(cmd):
+                return "No supported terminal emulator found. Install supported OS packages on Setup screen."
+        except Exception as e:
+            return f"Could not open a terminal: {e}"
+        return None
+
+    def _watch_launch(self, fut):
+        # Poll the launch from the Tk thread and report a failure once it is known
+        if not fut.done():
+            self.after(100, self._watch_launch, fut)
+            return
+        err = None if fut.cancelled() else fut.result()
+        if err:
+            messagebox.showerror("Terminal", err)
 
     # macOS helpers
     def _as_escape(self, s: str) -> str:
@@ -950,29 +1253,32 @@ class SetupFrame(ttk.Frame):
 
 
     def _has_kitty_macos(self) -> bool:
-        return self._check_cmd("kitty") or any(p.exists() for p in [
-            Path("/Applications/kitty.app"), Path("/Applications/Kitty.app"),
-            Path.home() / "Applications" / "kitty.app", Path.home() / "Applications" / "Kitty.app"
-        ])
+        return self._check_cmd("kitty") or _kitty_app_installed()
+
+    def rescan_tools(self):
+        # Explicit re-check: forget memoized PATH lookups so newly installed terminals are found
+        _clear_tool_caches()
+        self._update_os_tools_ui()
 
     def _check_cmd(self, cmd: str) -> bool:
-        return shutil.which(cmd) is not None
+        return _which(cmd) is not None
 
     def _recommended_tool_present(self) -> bool:
+        prefs = self.controller.preferences
         if self.selected_os == "macos":
-            pref = getattr(self.controller, "preferences", {}).get("macos_terminal_preference", "kitty")
+            pref = prefs.get("macos_terminal_preference", "kitty")
             if pref == "kitty":
                 return self._has_kitty_macos()
             return self._check_cmd(pref)
         if self.selected_os == "windows":
-            wpref = getattr(self.controller, "preferences", {}).get("windows_terminal_preference", "wt")
+            wpref = prefs.get("windows_terminal_preference", "wt")
             if wpref == "kitty":
                 return self._check_cmd("kitty")
             if wpref == "wezterm":
                 return self._check_cmd("wezterm")
             return self._check_cmd("wt.exe") or self._check_cmd("wt")
         if self.selected_os == "linux":
-            pref = getattr(self.controller, "preferences", {}).get("linux_terminal_preference", "kitty")
+            pref = prefs.get("linux_terminal_preference", "kitty")
             return self._check_cmd(pref) or (pref == "gnome-terminal" and self._check_cmd("gnome-terminal"))
         return False
 
@@ -983,14 +1289,52 @@ class SetupFrame(ttk.Frame):
             self.tools_text.configure(state="disabled")
             self.install_os_btn.config(state="disabled")
             return
+        # Tool detection (PATH lookups, app bundle checks) runs on a worker thread so the UI
+        # stays responsive; a request made while a scan is running triggers one re-scan after it
+        if self._tools_thread is not None:
+            self._tools_scan_stale = True
+            return
+        self._tools_scan_stale = False
+        os_name = self.selected_os
+        # Snapshot for the worker thread (the Tk thread may change preferences meanwhile)
+        prefs = dict(self.controller.preferences)
+
+        def worker():
+            try:
+                lines, can_skip_install = self._scan_os_tools(os_name, prefs)
+            except Exception as e:
+                lines, can_skip_install = [f"[Error] {e}"], False
+            # Build the text and its tag ranges here too, so the Tk thread only inserts and tags
+            self._tools_scan_q.put(self._layout_os_tools(lines) + (can_skip_install,))
+
+        self._tools_thread = threading.Thread(target=worker, daemon=True)
+        self._tools_thread.start()
+        self.after(50, self._drain_tools_scan)
+
+    def _drain_tools_scan(self):
+        try:
+            text, ranges, can_skip_install = self._tools_scan_q.get_nowait()
+        except queue.Empty:
+            self.after(50, self._drain_tools_scan)
+            return
+        self._tools_thread = None
+        if self._tools_scan_stale:
+            # OS or preference changed mid-scan: this result is out of date
+            self._update_os_tools_ui()
+            return
+        self._render_os_tools(text, ranges, can_skip_install)
+
+    def _scan_os_tools(self, os_name: str, prefs: dict):
+        # Returns (summary lines, whether the preferred terminal is already installed)
+        _prefetch_which(TOOL_PROBES.get(os_name, ()))
         lines = []
         can_skip_install = False
-        if self.selected_os == "macos":
+        if os_name == "macos":
             brew = self._check_cmd("brew")
             kitty = self._has_kitty_macos()
             wez = self._check_cmd("wezterm")
             ala = self._check_cmd("alacritty")
-            pref = getattr(self.controller, "preferences", {}).get("macos_terminal_preference", "kitty")
+            pref = prefs.get("macos_terminal_preference", "kitty")
             lines.append(f"Homebrew: {'✓' if brew else '✗'}")
             pretty = {"kitty": "Kitty", "wezterm": "WezTerm", "alacritty": "Alacritty"}
             status_map = {"kitty": kitty, "wezterm": wez, "alacritty": ala}
@@ -1003,13 +1347,12 @@ class SetupFrame(ttk.Frame):
                 parts.append(f"{pretty.get(name, name)}:{'✓' if ok else '✗'}")
             lines.append("Also available — " + ", ".join(parts))
             can_skip_install = status_map.get(pref, False)
-            self.install_os_btn.config(text="Install")
-        elif self.selected_os == "windows":
+        elif os_name == "windows":
             wt = self._check_cmd("wt.exe") or self._check_cmd("wt")
             winget = self._check_cmd("winget")
             kitty = self._check_cmd("kitty")
             wez = self._check_cmd("wezterm")
-            wpref = getattr(self.controller, "preferences", {}).get("windows_terminal_preference", "wt")
+            wpref = prefs.get("windows_terminal_preference", "wt")
             pretty = {"wt": "Windows Terminal", "kitty": "Kitty", "wezterm": "WezTerm"}
             status_map = {"wt": wt, "kitty": kitty, "wezterm": wez}
             lines.append(f"winget: {'✓' if winget else '✗'}")
@@ -1022,9 +1365,8 @@ class SetupFrame(ttk.Frame):
                 parts.append(f"{pretty.get(key, key)}:{'✓' if ok else '✗'}")
             lines.append("Also available — " + ", ".join(parts))
             can_skip_install = status_map.get(wpref, False)
-            self.install_os_btn.config(text="Install")
         else:  # linux
-            pref = getattr(self.controller, "preferences", {}).get("linux_terminal_preference", "kitty")
+            pref = prefs.get("linux_terminal_preference", "kitty")
             checks = [
                 ("kitty", self._check_cmd("kitty")),
                 ("konsole", self._check_cmd("konsole")),
@@ -1052,29 +1394,30 @@ class SetupFrame(ttk.Frame):
                 parts.append(f"{name}:{'✓' if ok else '✗'}")
             lines.append("Also available — " + ", ".join(parts))
             can_skip_install = status_map.get(pref, False)
-            self.install_os_btn.config(text="Install")
-        text = "OS tools check:\n" + "\n".join(lines)
-        # Render with colored ✓/✗
+        return lines, can_skip_install
+
+    @staticmethod
+    def _layout_os_tools(lines: list[str]):
+        # Returns the tool-check text and its ✓/✗ glyph positions as flat Text index pairs
+        # per tag ({"ok": [start, end, ...], "bad": [...]}); line 1 is the heading
+        ranges = {"ok": [], "bad": []}
+        for line_no, line in enumerate(lines, start=2):
+            for glyph, tag in (("✓", "ok"), ("✗", "bad")):
+                col = line.find(glyph)
+                while col != -1:
+                    ranges[tag] += (f"{line_no}.{col}", f"{line_no}.{col + 1}")
+                    col = line.find(glyph, col + 1)
+        return "OS tools check:\n" + "\n".join(lines), ranges
+
+    def _render_os_tools(self, text: str, ranges: dict, can_skip_install: bool):
+        self.install_os_btn.config(text="Install")
+        # Render with colored ✓/✗: one insert, then one tag_add per tag with all index pairs
         self.tools_text.configure(state="normal")
         self.tools_text.delete("1.0", "end")
         self.tools_text.insert("1.0", text)
-        # Apply color tags to all occurrences
-        start = "1.0"
-        while True:
-            idx = self.tools_text.search("✓", start, stopindex="end")
-            if not idx:
-                break
-            end = f"{idx}+1c"
-            self.tools_text.tag_add("ok", idx, end)
-            start = end
-        start = "1.0"
-        while True:
-            idx = self.tools_text.search("✗", start, stopindex="end")
-            if not idx:
-                break
-            end = f"{idx}+1c"
-            self.tools_text.tag_add("bad", idx, end)
-            start = end
+        for tag, indices in ranges.items():
+            if indices:
+                self.tools_text.tag_add(tag, *indices)
         self.tools_text.configure(state="disabled")
         self.install_os_btn.config(state=("disabled" if can_skip_install else "normal"))
 
@@ -1102,17 +1445,17 @@ class SetupFrame(ttk.Frame):
         # Prefix with title + marker so we can identify and close these later
         prefix = f"$Host.UI.RawUI.WindowTitle = '{WINDOW_MARKER}'; Write-Host '{CONTENT_MARKER}'; "
         ps_cmd = prefix + ps_cmd
-        wt = shutil.which("wt.exe") or shutil.which("wt")
+        wt = _which("wt.exe") or _which("wt")
         if wt:
             p = subprocess.Popen([wt, "new-window", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
         else:
             p = subprocess.Popen(["cmd", "/c", "start", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
 
@@ -1170,6 +1513,7 @@ class SetupFrame(ttk.Frame):
             self.controller.save_prefs()
         except Exception:
             pass
+        _clear_tool_caches()
         self._update_os_tools_ui()
         self.status.config(text="Preferences reset to default settings.")
 
@@ -1227,160 +1571,7 @@ class SetupFrame(ttk.Frame):
         target = APP_ROOT.resolve()
         tmp_dir = Path(tempfile.gettempdir())
         script_path = tmp_dir / f"vp_uninstall_{int(time.time())}.py"
-        content_lines = [
-            "#!/usr/bin/env python3",
-            "import os, sys, shutil, time, stat, subprocess, ctypes",
-            "from pathlib import Path",
-            "",
-            f"TARGET = Path({repr(str(target))})",
-            "FOLDER_NAME = TARGET.name",
-            "print('Safe Uninstall helper')",
-            "print(f'Deleting: {TARGET}')",
-            "",
-            "# Safety check - refuses dangerous paths",
-            "def safe_path(p: Path) -> bool:",
-            "    try:",
-            "        p = p.resolve()",
-            "    except Exception:",
-            "        return False",
-            "    if not p.exists() or not p.is_dir():",
-            "        return False",
-            "    # Never operate on root, user home, or extremely short paths",
-            "    if p == Path('/') or p == Path.home() or len(str(p)) < 8:",
-            "        return False",
-            "    # Project markers",
-            "    markers = [(p / 'main.py').exists(), (p / 'README.md').exists()]",
-            "    if not all(markers):",
-            "        return False",
-            "    return True",
-            "",
-            "if not safe_path(TARGET):",
-            "    print('[Uninstall] Target path failed safety checks. Aborting.')",
-            "    sys.exit(1)",
-            "",
-            "# Type exact folder name to confirm",
-            "try:",
-            "    typed = input(f\"Type the project folder name to confirm: {FOLDER_NAME} \")",
-            "except EOFError:",
-            "    typed = ''",
-            "if typed.strip() != FOLDER_NAME:",
-            "    print('[Uninstall] Confirmation did not match. Aborting.')",
-            "    sys.exit(1)",
-            "",
-            "def try_send2trash(path: Path) -> bool:",
-            "    try:",
-            "        import send2trash  # optional, if present",
-            "        send2trash.send2trash(str(path))",
-            "        return True",
-            "    except Exception:",
-            "        return False",
-            "",
-            "def macos_trash(path: Path) -> bool:",
-            "    # Use Finder to move to Trash",
-            "    try:",
-            "        esc = repr(str(path))",
-            "        script = [",
-            "            'tell application \"Finder\"',",
-            "            'delete POSIX file ' + esc,",
-            "            'end tell',",
-            "        ]",
-            "        args = ['osascript']",
-            "        for line in script:",
-            "            args += ['-e', line]",
-            "        subprocess.check_call(args)",
-            "        return True",
-            "    except Exception:",
-            "        return False",
-            "",
-            "def windows_trash(path: Path) -> bool:",
-            "    # Use SHFileOperation with FOF_ALLOWUNDO to send to Recycle Bin",
-            "    try:",
-            "        from ctypes import wintypes",
-            "        FO_DELETE = 3",
-            "        FOF_ALLOWUNDO = 0x0040",
-            "        FOF_NOCONFIRMATION = 0x0010",
-            "        class SHFILEOPSTRUCTW(ctypes.Structure):",
-            "            _fields_ = [",
-            "                ('hwnd', wintypes.HWND),",
-            "                ('wFunc', wintypes.UINT),",
-            "                ('pFrom', wintypes.LPCWSTR),",
-            "                ('pTo', wintypes.LPCWSTR),",
-            "                ('fFlags', wintypes.UINT),",
-            "                ('fAnyOperationsAborted', wintypes.BOOL),",
-            "                ('hNameMappings', wintypes.LPVOID),",
-            "                ('lpszProgressTitle', wintypes.LPCWSTR),",
-            "            ]",
-            "        shfo = SHFILEOPSTRUCTW()",
-            "        shfo.hwnd = None",
-            "        shfo.wFunc = FO_DELETE",
-            "        # double-NULL-terminated path list",
-            "        shfo.pFrom = str(path) + '\\0\\0'",
-            "        shfo.pTo = None",
-            "        shfo.fFlags = FOF_ALLOWUNDO | FOF_NOCONFIRMATION",
-            "        res = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(shfo))",
-            "        return res == 0",
-            "    except Exception:",
-            "        return False",
-            "",
-            "def linux_trash(path: Path) -> bool:",
-            "    # Try gio trash (GNOME/FreeDesktop). Fall back to safe rename if not available.",
-            "    try:",
-            "        if shutil.which('gio'):",
-            "            subprocess.check_call(['gio', 'trash', str(path)])",
-            "            return True",
-            "    except Exception:",
-            "        pass",
-            "    return False",
-            "",
-            "def safe_rename(path: Path) -> Path | None:",
-            "    parent = path.parent",
-            "    ts = time.strftime('%Y%m%d_%H%M%S')",
-            "    new = parent / (path.name + '.DELETE_ME_' + ts)",
-            "    # Avoid collisions",
-            "    i = 0",
-            "    while new.exists() and i < 50:",
-            "        i += 1",
-            "        new = parent / (path.name + '.DELETE_ME_' + ts + '_' + str(i))",
-            "    try:",
-            "        path.rename(new)",
-            "        return new",
-            "    except Exception:",
-            "        return None",
-            "",
-            "# Allow GUI to close any file handles",
-            "time.sleep(1.0)",
-            "",
-            "moved = False",
-            "# First, try optional send2trash if installed",
-            "if try_send2trash(TARGET):",
-            "    print('[Uninstall] Sending to Trash.')",
-            "    moved = True",
-            "else:",
-            "    if sys.platform.startswith('darwin'):",
-            "        if macos_trash(TARGET):",
-            "            print('[Uninstall] Moved to Trash.')",
-            "            moved = True",
-            "    elif os.name == 'nt':",
-            "        if windows_trash(TARGET):",
-            "            print('[Uninstall] Moved to Recycle Bin.')",
-            "            moved = True",
-            "    else:",
-            "        if linux_trash(TARGET):",
-            "            print('[Uninstall] Moved to Trash.')",
-            "            moved = True",
-            "",
-            "if not moved:",
-            "    print('[Uninstall] Trash not available. Performing non-destructive safe rename...')",
-            "    renamed = safe_rename(TARGET)",
-            "    if renamed is None:",
-            "        print('[Uninstall] Safe rename failed. No changes were made. Aborting.')",
-            "        sys.exit(1)",
-            "    print(f'[Uninstall] Folder renamed to: {renamed}')",
-            "",
-            "print('[Uninstall] Complete. You can restore from Trash or delete the renamed folder manually.')",
-        ]
-        content = "\n".join(content_lines) + "\n"
-        script_path.write_text(content, encoding="utf-8")
+        script_path.write_bytes(UNINSTALL_SCRIPT_TEMPLATE.format(target=str(target)).encode("utf-8"))
         os.chmod(script_path, 0o700)
         return script_path
 
@@ -1399,44 +1590,199 @@ class SetupFrame(ttk.Frame):
             self._linux_run_in_terminal(cmd)
 
     def _linux_run_in_terminal(self, sh_cmd: str):
-        # Wrap in bash -lc when launching emulators; prefix with title+marker
+        if not self._linux_spawn_terminal(sh_cmd):
+            messagebox.showerror("Terminal", "No supported terminal emulator found. Install supported OS packages on Setup screen.")
+
+    def _linux_spawn_terminal(self, sh_cmd: str) -> bool:
+        # Wrap in bash -lc when launching emulators; prefix with title+marker.
+        # Returns False if no emulator could be started (no Tk calls, so worker threads can use it).
         prefix = f'printf "\\033]0;{WINDOW_MARKER}\\007"; echo "{CONTENT_MARKER}"; '
         sh_cmd = prefix + sh_cmd
-        candidates = []
-        if shutil.which("kitty"):
-            candidates.append(["kitty", "--hold", "bash", "-lc", sh_cmd])
-        if shutil.which("alacritty"):
-            candidates.append(["alacritty", "-e", "bash", "-lc", sh_cmd])
-        if shutil.which("wezterm"):
-            candidates.append(["wezterm", "start", "--", "bash", "-lc", sh_cmd])
-        if shutil.which("gnome-terminal"):
-            candidates.append(["gnome-terminal", "--window", "--", "bash", "-lc", sh_cmd])
-        if shutil.which("konsole"):
-            candidates.append(["konsole", "--new-window", "-e", "bash", "-lc", sh_cmd])
-        if shutil.which("xterm"):
-            candidates.append(["xterm", "-e", "bash", "-lc", sh_cmd])
-        if shutil.which("x-terminal-emulator"):
-            candidates.append(["x-terminal-emulator", "-e", "bash", "-lc", sh_cmd])
+        candidates = [[*argv, sh_cmd] for name, argv in LINUX_SETUP_TERMINALS.items() if _which(name)]
         for tcmd in candidates:
             try:
                 p = subprocess.Popen(tcmd)
                 try:
-                    self.controller.open_terms.append(p)
+                    self.controller.track_terminal(p)
                 except Exception:
                     pass
-                return
+                return True
             except FileNotFoundError:
                 continue
-        messagebox.showerror("No supported terminal emulator found. Install supported OS packages on Setup screen.")
+        return False
 
     def terminate_running_process(self):
         if self.proc and self.proc.poll() is None:
             try:
-                self.proc.terminate()
+                if os.name == "nt":
+                    # terminate() would only stop pip itself; taskkill /T also ends its children
+                    rc = subprocess.call(
+                        ["taskkill", "/T", "/F", "/PID", str(self.proc.pid)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                    )
+                    if rc != 0:
+                        self.proc.terminate()
+                else:
+                    # pip leads its own session, so its pid is also the process group id
+                    os.killpg(self.proc.pid, signal.SIGTERM)
             except Exception:
                 pass
 
 
+# Self-contained uninstall helper written to a temp file by SetupFrame._create_uninstall_script.
+# {target!r} is filled in with str.format (literal braces are doubled).
+UNINSTALL_SCRIPT_TEMPLATE = r'''#!/usr/bin/env python3
+import os, sys, shutil, time, stat, subprocess, ctypes, secrets
+from pathlib import Path
+
+TARGET = Path({target!r})
+FOLDER_NAME = TARGET.name
+print('Safe Uninstall helper')
+print(f'Deleting: {{TARGET}}')
+
+# Safety check - refuses dangerous paths
+def safe_path(p: Path) -> bool:
+    try:
+        p = p.resolve()
+    except Exception:
+        return False
+    if not p.exists() or not p.is_dir():
+        return False
+    # Never operate on root, user home, or extremely short paths
+    if p == Path('/') or p == Path.home() or len(str(p)) < 8:
+        return False
+    # Project markers
+    markers = [(p / 'main.py').exists(), (p / 'README.md').exists()]
+    if not all(markers):
+        return False
+    return True
+
+if not safe_path(TARGET):
+    print('[Uninstall] Target path failed safety checks. Aborting.')
+    sys.exit(1)
+
+# Type exact folder name to confirm
+try:
+    typed = input(f"Type the project folder name to confirm: {{FOLDER_NAME}} ")
+except EOFError:
+    typed = ''
+if typed.strip() != FOLDER_NAME:
+    print('[Uninstall] Confirmation did not match. Aborting.')
+    sys.exit(1)
+
+def try_send2trash(path: Path) -> bool:
+    try:
+        import send2trash  # optional, if present
+        send2trash.send2trash(str(path))
+        return True
+    except Exception:
+        return False
+
+def macos_trash(path: Path) -> bool:
+    # Use Finder to move to Trash
+    try:
+        esc = repr(str(path))
+        script = [
+            'tell application "Finder"',
+            'delete POSIX file ' + esc,
+            'end tell',
+        ]
+        args = ['osascript']
+        for line in script:
+            args += ['-e', line]
+        subprocess.check_call(args)
+        return True
+    except Exception:
+        return False
+
+def windows_trash(path: Path) -> bool:
+    # Use SHFileOperation with FOF_ALLOWUNDO to send to Recycle Bin
+    try:
+        from ctypes import wintypes
+        FO_DELETE = 3
+        FOF_ALLOWUNDO = 0x0040
+        FOF_NOCONFIRMATION = 0x0010
+        class SHFILEOPSTRUCTW(ctypes.Structure):
+            _fields_ = [
+                ('hwnd', wintypes.HWND),
+                ('wFunc', wintypes.UINT),
+                ('pFrom', wintypes.LPCWSTR),
+                ('pTo', wintypes.LPCWSTR),
+                ('fFlags', wintypes.UINT),
+                ('fAnyOperationsAborted', wintypes.BOOL),
+                ('hNameMappings', wintypes.LPVOID),
+                ('lpszProgressTitle', wintypes.LPCWSTR),
+            ]
+        shfo = SHFILEOPSTRUCTW()
+        shfo.hwnd = None
+        shfo.wFunc = FO_DELETE
+        # double-NULL-terminated path list
+        shfo.pFrom = str(path) + '\0\0'
+        shfo.pTo = None
+        shfo.fFlags = FOF_ALLOWUNDO | FOF_NOCONFIRMATION
+        res = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(shfo))
+        return res == 0
+    except Exception:
+        return False
+
+def linux_trash(path: Path) -> bool:
+    # Try gio trash (GNOME/FreeDesktop). Fall back to safe rename if not available.
+    try:
+        if shutil.which('gio'):
+            subprocess.check_call(['gio', 'trash', str(path)])
+            return True
+    except Exception:
+        pass
+    return False
+
+def safe_rename(path: Path) -> Path | None:
+    parent = path.parent
+    ts = time.strftime('%Y%m%d_%H%M%S')
+    # A random suffix avoids collisions without probing for free names first (check-then-rename
+    # is racy, and POSIX rename would silently replace an empty directory of the same name)
+    new = parent / (path.name + '.DELETE_ME_' + ts + '_' + secrets.token_hex(3))
+    try:
+        path.rename(new)
+        return new
+    except Exception:
+        return None
+
+# Allow GUI to close any file handles
+time.sleep(1.0)
+
+moved = False
+# First, try optional send2trash if installed
+if try_send2trash(TARGET):
+    print('[Uninstall] Sending to Trash.')
+    moved = True
+else:
+    if sys.platform.startswith('darwin'):
+        if macos_trash(TARGET):
+            print('[Uninstall] Moved to Trash.')
+            moved = True
+    elif os.name == 'nt':
+        if windows_trash(TARGET):
+            print('[Uninstall] Moved to Recycle Bin.')
+            moved = True
+    else:
+        if linux_trash(TARGET):
+            print('[Uninstall] Moved to Trash.')
+            moved = True
+
+if not moved:
+    print('[Uninstall] Trash not available. Performing non-destructive safe rename...')
+    renamed = safe_rename(TARGET)
+    if renamed is None:
+        print('[Uninstall] Safe rename failed. No changes were made. Aborting.')
+        sys.exit(1)
+    print(f'[Uninstall] Folder renamed to: {{renamed}}')
+
+print('[Uninstall] Complete. You can restore from Trash or delete the renamed folder manually.')
+'''
+
+
 class ShowcaseFrame(ttk.Frame):
     def __init__(self, parent, controller: App):
         super().__init__(parent)
@@ -1466,16 +1812,37 @@ class ShowcaseFrame(ttk.Frame):
         self.listbox.bind("<<ListboxSelect>>", self.on_list_select)
         # Keep an ordered list of script paths aligned with the listbox items
         self.scripts = []
+        # (directory fingerprint, sorted scripts, listbox labels) from the last scan
+        self._scripts_cache = None
+        # Preview cache: path -> entry (see _build_preview_entry); only touched on the Tk thread
+        self._preview_cache: OrderedDict = OrderedDict()
+        # Previews are read and tokenized on a worker; results come back through a queue and
+        # only the newest request (by sequence number) is shown
+        self._preview_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vp-preview")
+        self._preview_q = queue.Queue()
+        self._preview_seq = 0
+        self._preview_future = None
+        self._preview_poll = None
+        # Pending after() id of a debounced selection preview
+        self._preview_after_id = None
+        # Script currently shown (or being loaded) in the preview; None forces the next load
+        self._current_preview_path = None
+        # Pending after_idle() id of a highlight pass, and line starts of the highlighted preview
+        self._hl_job = None
+        self._hl_line_starts = None
 
         # Code preview area
         self.path_label = ttk.Label(right, text="Code preview: select an option to preview", foreground="#666")
         self.path_label.pack(anchor="w")
         code_frame = ttk.Frame(right)
         code_frame.pack(fill="both", expand=True)
-        self.code_text = tk.Text(code_frame, wrap="none", font=("Menlo", 12))
+        self.code_text = tk.Text(code_frame, wrap="none", font=("Menlo", 12), undo=False)
         xscroll = ttk.Scrollbar(code_frame, orient="horizontal", command=self.code_text.xview)
         yscroll = ttk.Scrollbar(code_frame, orient="vertical", command=self.code_text.yview)
-        self.code_text.configure(xscrollcommand=xscroll.set, yscrollcommand=yscroll.set)
+        self._code_yscroll = yscroll
+        self.code_text.configure(xscrollcommand=xscroll.set, yscrollcommand=self._on_code_yscroll)
+        # Scrolling (any source) reports through yscrollcommand; resizing shows more lines
+        self.code_text.bind("<Configure>", lambda _e: self._schedule_highlight())
         self.code_text.pack(side="left", fill="both", expand=True)
         yscroll.pack(side="right", fill="y")
         xscroll.pack(side="bottom", fill="x")
@@ -1493,12 +1860,29 @@ class ShowcaseFrame(ttk.Frame):
         self.refresh_scripts()
 
     def on_show(self):
+        # Terminals may have been installed from Setup; resolve them afresh for launching
+        _clear_tool_caches()
         self.refresh_scripts()
         self._load_preview()
 
+    def on_hide(self):
+        # Drop pending preview/highlight jobs while another frame is raised; on_show reloads
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if self._hl_job is not None:
+            self.after_cancel(self._hl_job)
+            self._hl_job = None
+
     def on_list_select(self, _event=None):
         self._update_buttons()
-        self._load_preview()
+        self._schedule_preview_load()
+
+    def _schedule_preview_load(self):
+        # Arrow-key navigation fires a selection per step; only preview where it comes to rest
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(PREVIEW_SELECT_DELAY_MS, self._load_preview)
 
     def _update_buttons(self):
         sel = self._selected_script_path() is not None
@@ -1506,31 +1890,49 @@ class ShowcaseFrame(ttk.Frame):
 
     def refresh_scripts(self):
         self.listbox.delete(0, "end")
-        scripts = []
+        # The list (and the selection) is rebuilt, so the next preview must load afresh
+        self._current_preview_path = None
         assign_dir = APP_ROOT / "assignments"
-        if assign_dir.exists():
-            # Discover Python files inside immediate subdirectories (nested layout)
-            scripts = list(assign_dir.glob("*/*.py"))
-        # Sort by numeric prefix:
-        # - Prefer numeric prefix from the first subdirectory (e.g., 00_showcase_check/),
-        # - Fallback to numeric prefix on the filename stem,
-        # - Then alphabetical.
-        def sort_key(p: Path):
-            try:
-                rel = p.relative_to(assign_dir)
-                first = rel.parts[0] if len(rel.parts) >= 2 else ""
-            except Exception:
-                first = ""
-            m_dir = re.match(r"^(\d+)", first)
-            m_file = re.match(r"^(\d+)", p.stem)
-            primary = int(m_dir.group(1)) if m_dir else (int(m_file.group(1)) if m_file else 10**9)
-            return (primary, first.lower(), p.stem.lower())
-        scripts.sort(key=sort_key)
+        # One scandir of the assignments folder lists the subfolders and fingerprints the tree by
+        # their mtimes (adding, removing or renaming a script changes its folder's mtime)
+        try:
+            with os.scandir(assign_dir) as it:
+                subdirs = sorted((e.name, e.path, e.stat().st_mtime_ns) for e in it if e.is_dir())
+            key = (assign_dir.stat().st_mtime_ns, tuple((name, mtime) for name, _, mtime in subdirs))
+        except OSError:
+            subdirs, key = [], None
+        if key is not None and self._scripts_cache is not None and self._scripts_cache[0] == key:
+            scripts, labels = self._scripts_cache[1], self._scripts_cache[2]
+        else:
+            # Discover Python files inside immediate subdirectories (nested layout), computing
+            # each sort key once during the walk:
+            # - Prefer numeric prefix from the first subdirectory (e.g., 00_showcase_check/),
+            # - Fallback to numeric prefix on the filename stem,
+            # - Then alphabetical.
+            keyed = []
+            for name, path, _ in subdirs:
+                m_dir = LEADING_NUMBER_RE.match(name)
+                try:
+                    with os.scandir(path) as it:
+                        files = [e.name for e in it if e.name.endswith(".py") and e.is_file()]
+                except OSError:
+                    continue
+                for fname in files:
+                    stem = fname[:-3]
+                    if m_dir:
+                        primary = int(m_dir.group(1))
+                    else:
+                        m_file = LEADING_NUMBER_RE.match(stem)
+                        primary = int(m_file.group(1)) if m_file else 10**9
+                    keyed.append((primary, name.lower(), stem.lower(), assign_dir / name / fname))
+            keyed.sort(key=lambda k: k[:3])
+            scripts = [k[3] for k in keyed]
+            # Display friendly titles derived from filenames
+            labels = [self._friendly_label(p) for p in scripts]
+            self._scripts_cache = (key, scripts, labels) if key is not None else None
         # Save paths aligned with listbox entries
         self.scripts = scripts
-        for p in scripts:
-            # Display friendly title derived from filename
-            self.listbox.insert("end", self._friendly_label(p))
+        self.listbox.insert("end", *labels)
         self._update_buttons()
 
     def _selected_script_path(self):
@@ -1543,42 +1945,7 @@ class ShowcaseFrame(ttk.Frame):
         return None
 
     def _friendly_label(self, p: Path) -> str:
-        name = p.stem
-        m = re.match(r"^(\d+)[-_](.+)$", name, re.IGNORECASE)
-        base = m.group(2) if m else name
-        base = re.sub(r"[_\-]+", " ", base).strip()
-        base = base if base else name
-        # Title-case then restore acronyms
-        title = base.title()
-        acronyms = {
-            "api": "API",
-            "pil": "PIL",
-            "tcp": "TCP",
-            "udp": "UDP",
-            "pcap": "PCAP",
-            "http": "HTTP",
-            "https": "HTTPS",
-            "url": "URL",
-            "ip": "IP",
-            "dns": "DNS",
-            "ssl": "SSL",
-            "tls": "TLS",
-            "id3": "ID3",
-            "nltk": "NLTK",
-            "ml": "ML",
-            "oop": "OOP",
-            "exif": "EXIF",
-            "lsb": "LSB",
-            "mp3": "MP3",
-            "sha1": "SHA1",
-            "md5": "MD5",
-            "sha256": "SHA256",
-            "csv": "CSV",
-            "json": "JSON",
-        }
-        words = title.split()
-        words = [acronyms.get(w.lower(), w) for w in words]
-        return " ".join(words)
+        return _friendly_label_for(p.stem)
 
     def _setup_code_tags(self):
         t = self.code_text
@@ -1606,62 +1973,184 @@ class ShowcaseFrame(ttk.Frame):
         for tag in getattr(self, "_py_tags", []):
             self.code_text.tag_remove(tag, "1.0", "end")
 
-    def _highlight_code(self, content: str):
-        # Precompute line starts so we can convert offsets to Tk indices efficiently
+    def _highlight_code(self, entry: dict):
+        # Show the highlighting for a preview entry. Blocks are tagged lazily as they scroll into
+        # view; ranges computed once are kept in the entry and reused on later previews.
+        self._hl_entry = entry
+        self._hl_line_starts = entry["line_starts"]
+        self._hl_done = set()
+        if entry["triple"]:
+            self.code_text.tag_add("py_string", *entry["triple"])
+        self._highlight_visible()
+
+    def _on_code_yscroll(self, first, last):
+        self._code_yscroll.set(first, last)
+        self._schedule_highlight()
+
+    def _schedule_highlight(self):
+        # Coalesce scroll/resize bursts into one pass once Tk is idle
+        if self._hl_job is None:
+            self._hl_job = self.after_idle(self._highlight_visible)
+
+    def _highlight_visible(self):
+        self._hl_job = None
+        line_starts = self._hl_line_starts
+        if not line_starts:
+            return
+        first = int(self.code_text.index("@0,0").split(".")[0])
+        last = int(self.code_text.index(f"@0,{self.code_text.winfo_height()}").split(".")[0])
+        # Overscan one block either side so short scrolls land on already-tagged text
+        first_block = max((first - 1) // HIGHLIGHT_BLOCK_LINES - 1, 0)
+        last_block = min((last - 1) // HIGHLIGHT_BLOCK_LINES + 1, (len(line_starts) - 1) // HIGHLIGHT_BLOCK_LINES)
+        blocks = self._hl_entry["blocks"]
+        # Gather the index pairs of every newly shown block, then issue one tag_add per tag
+        pending: dict[str, list[str]] = {}
+        for block in range(first_block, last_block + 1):
+            if block in self._hl_done:
+                continue
+            self._hl_done.add(block)
+            ranges = blocks.get(block)
+            if ranges is None:
+                ranges = blocks[block] = self._block_ranges(block)
+            for tag, indices in ranges.items():
+                pending.setdefault(tag, []).extend(indices)
+        for tag, indices in pending.items():
+            self.code_text.tag_add(tag, *indices)
+
+    def _block_ranges(self, block: int) -> dict:
+        # Returns {tag: [start, end, ...]} Tk index pairs for one block of lines
+        content = self._hl_entry["content"]
+        line_starts = self._hl_line_starts
+        start_line = block * HIGHLIGHT_BLOCK_LINES
+        end_line = min(start_line + HIGHLIGHT_BLOCK_LINES, len(line_starts))
+        ranges: dict[str, list[str]] = {}
+        # Highlight the block in runs of lines, leaving out very long lines
+        start = line_starts[start_line]
+        for ln in range(start_line, end_line):
+            line_end = line_starts[ln + 1] if ln + 1 < len(line_starts) else len(content)
+            if line_end - line_starts[ln] > PREVIEW_LONG_LINE_CHARS:
+                if line_starts[ln] > start:
+                    self._highlight_range(start, line_starts[ln], ranges, start_line, ln)
+                start = line_end
+        end = line_starts[end_line] if end_line < len(line_starts) else len(content)
+        if end > start:
+            self._highlight_range(start, end, ranges, start_line, end_line)
+        return ranges
+
+    def _highlight_range(self, start: int, end: int, ranges: dict, first_line: int, end_line: int):
+        # Collect the single-line pattern matches within content[start:end]; start/end are line
+        # starts, so matching with pos/endpos (no slicing) behaves as it would over the whole file.
+        # Matches lie in lines [first_line, end_line), so offset lookups only bisect those lines.
+        content = self._hl_entry["content"]
+        line_starts = self._hl_line_starts
+        hi = min(end_line + 1, len(line_starts))
+        for pattern, tag, group in PY_HIGHLIGHT_PATTERNS:
+            indices = ranges.setdefault(tag, [])
+            for m in pattern.finditer(content, start, end):
+                indices += (
+                    _offset_to_index(line_starts, m.start(group), first_line, hi),
+                    _offset_to_index(line_starts, m.end(group), first_line, hi),
+                )
+            if not indices:
+                del ranges[tag]
+
+    @staticmethod
+    def _build_preview_entry(path: Path, cached):
+        # Runs on the preview worker. Returns the preview entry for path: content, line starts,
+        # triple-quoted string ranges and (filled in lazily on the Tk thread) per-block tag
+        # ranges. A cached entry is reused while the file's (mtime, size) is unchanged.
+        try:
+            st = path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if cached is not None and cached["key"] == key:
+                return cached
+            # Read one byte past the cap to tell whether the script was cut short
+            with path.open("rb") as f:
+                raw = f.read(PREVIEW_MAX_BYTES + 1)
+            content = raw[:PREVIEW_MAX_BYTES].decode("utf-8", errors="replace")
+            if len(raw) > PREVIEW_MAX_BYTES:
+                content += f"\n\n# … preview truncated at {PREVIEW_MAX_BYTES // 1024} KiB …\n"
+        except Exception as e:
+            # Read errors are shown but not cached
+            content = f"[Error reading file]\n{e}"
+            key = None
         line_starts = [0]
         for m in re.finditer("\n", content):
             line_starts.append(m.end())
-
-        def to_index(pos: int) -> str:
-            line_idx = bisect.bisect_right(line_starts, pos) - 1
-            col = pos - line_starts[line_idx]
-            return f"{line_idx + 1}.{col}"
-
-        def apply(pattern: re.Pattern, tag: str, group: int | None = None):
-            for m in pattern.finditer(content):
-                start = m.start(group or 0)
-                end = m.end(group or 0)
-                self.code_text.tag_add(tag, to_index(start), to_index(end))
-
-        # Patterns
-        triple = re.compile(r"('''.*?'''|\"\"\".*?\"\"\")", re.DOTALL)
-        string_ = re.compile(r"('([^'\\\n]|\\.)*'|\"([^\"\\\n]|\\.)*\")")
-        comment = re.compile(r"#.*", re.MULTILINE)
-        decorator = re.compile(r"(?m)^\s*@\w+")
-        # Keywords
-        kw = re.compile(r"\\b(" + "|".join(re.escape(k) for k in keyword.kwlist) + r")\\b")
-        # Numbers (simple)
-        number = re.compile(r"(?<![\w.])\d+(?:\.\d+)?")
-        # def/class names
-        defname = re.compile(r"\bdef\s+(\w+)")
-        classname = re.compile(r"\bclass\s+(\w+)")
-
-        # Order: strings first, then comments, then decorators/keywords/numbers/names
-        apply(triple, "py_string")
-        apply(string_, "py_string")
-        apply(comment, "py_comment")
-        apply(decorator, "py_decorator")
-        apply(kw, "py_keyword")
-        apply(number, "py_number")
-        apply(defname, "py_defname", group=1)
-        apply(classname, "py_classname", group=1)
+        # Triple-quoted strings can span blocks, so they are found once over the whole file
+        triple = []
+        for m in PY_TRIPLE_STRING_RE.finditer(content):
+            triple += (_offset_to_index(line_starts, m.start()), _offset_to_index(line_starts, m.end()))
+        return {"key": key, "content": content, "line_starts": line_starts, "triple": triple, "blocks": {}}
 
     def _load_preview(self):
+        # Loading now (the debounce fired, or a direct call) supersedes a scheduled load
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
         path = self._selected_script_path()
+        # Re-clicking the row already shown changes nothing (with nothing selected, always clear
+        # the preview: the list may have been rebuilt under it)
+        if path is not None and path == self._current_preview_path:
+            return
+        self._current_preview_path = path
+        # A newer selection supersedes any preview still being prepared
+        self._preview_seq += 1
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+            self._preview_future = None
         self.code_text.config(state="normal")
         self.code_text.delete("1.0", "end")
         self._clear_highlight_tags()
+        self._hl_line_starts = None
+        self.code_text.config(state="disabled")
         if not path or not path.exists():
             self.path_label.config(text="Code preview: select an option to preview")
-            self.code_text.config(state="disabled")
             return
-        try:
-            content = path.read_text(encoding="utf-8", errors="replace")
-        except Exception as e:
-            content = f"[Error reading file]\n{e}"
         self.path_label.config(text=f"Code preview: {path.relative_to(APP_ROOT)}")
-        self.code_text.insert("1.0", content)
-        self._highlight_code(content)
+        seq = self._preview_seq
+        cached = self._preview_cache.get(path)
+
+        def work():
+            try:
+                entry = self._build_preview_entry(path, cached)
+            except Exception:
+                logger.exception("Preview failed for %s", path)
+                entry = None
+            # Always answer, so the poller knows this request is finished
+            self._preview_q.put((seq, path, entry))
+
+        self._preview_future = self._preview_pool.submit(work)
+        if self._preview_poll is None:
+            self._preview_poll = self.after(10, self._drain_preview)
+
+    def _drain_preview(self):
+        self._preview_poll = None
+        shown = None
+        try:
+            while True:
+                seq, path, entry = self._preview_q.get_nowait()
+                if seq == self._preview_seq:
+                    shown = (path, entry)
+        except queue.Empty:
+            pass
+        if shown is None:
+            # Keep polling only while a request is outstanding
+            if self._preview_future is not None:
+                self._preview_poll = self.after(20, self._drain_preview)
+            return
+        self._preview_future = None
+        path, entry = shown
+        if entry is None:
+            return
+        if entry["key"] is not None:
+            self._preview_cache[path] = entry
+            self._preview_cache.move_to_end(path)
+            if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        self.code_text.config(state="normal")
+        self.code_text.insert("1.0", entry["content"])
+        self._highlight_code(entry)
         self.code_text.config(state="disabled")
 
     def run_in_terminal(self):
@@ -1684,10 +2173,7 @@ class ShowcaseFrame(ttk.Frame):
         return s.replace("\\", "\\\\").replace('"', '\\"')
 
     def _has_kitty_macos(self) -> bool:
-        return shutil.which("kitty") is not None or any(p.exists() for p in [
-            Path("/Applications/kitty.app"), Path("/Applications/Kitty.app"),
-            Path.home() / "Applications" / "kitty.app", Path.home() / "Applications" / "Kitty.app"
-        ])
+        return _which("kitty") is not None or _kitty_app_installed()
 
     def _osascript(self, lines: list[str]):
         args = ["osascript"]
@@ -1707,32 +2193,17 @@ class ShowcaseFrame(ttk.Frame):
             f"echo; echo 'Successful. Press Enter to shutdown'; read"
         )
         # Prefer macOS terminals similar to Linux: kitty -> wezterm -> alacritty
-        pref = getattr(self.controller, "preferences", {}).get("macos_terminal_preference", "kitty")
-        order = [pref] + [t for t in ["kitty", "wezterm", "alacritty"] if t != pref]
+        pref = self.controller.preferences.get("macos_terminal_preference", "kitty")
+        order = [pref] + [t for t in MACOS_SCRIPT_TERMINALS if t != pref]
         for term in order:
-            if not shutil.which(term):
+            if term not in MACOS_SCRIPT_TERMINALS or not _which(term):
                 continue
-            if term == "kitty":
-                p = subprocess.Popen(["kitty", "--title", WINDOW_MARKER, "--hold", "bash", "-lc", cmd])
-                try:
-                    self.controller.open_terms.append(p)
-                except Exception:
-                    pass
-                return
-            if term == "wezterm":
-                p = subprocess.Popen(["wezterm", "start", "--", "bash", "-lc", cmd])
-                try:
-                    self.controller.open_terms.append(p)
-                except Exception:
-                    pass
-                return
-            if term == "alacritty":
-                p = subprocess.Popen(["alacritty", "--title", WINDOW_MARKER, "-e", "bash", "-lc", cmd])
-                try:
-                    self.controller.open_terms.append(p)
-                except Exception:
-                    pass
-                return
+            p = subprocess.Popen([*MACOS_SCRIPT_TERMINALS[term], cmd])
+            try:
+                self.controller.track_terminal(p)
+            except Exception:
+                pass
+            return
         messagebox.showerror("Run in Terminal", "No supported macOS terminal found. Install one from Setup first.")
 
     def _run_in_windows_terminal(self, script_path: Path):
@@ -1746,58 +2217,58 @@ class ShowcaseFrame(ttk.Frame):
             f"& '{py}' '{rel}'; "
             f"Write-Host ''; Read-Host 'Successful. Press Enter to shutdown'"
         )
-        wpref = getattr(self.controller, "preferences", {}).get("windows_terminal_preference", "wt")
+        wpref = self.controller.preferences.get("windows_terminal_preference", "wt")
         # Try preferred first
-        if wpref == "kitty" and shutil.which("kitty"):
+        if wpref == "kitty" and _which("kitty"):
             p = subprocess.Popen(["kitty", "--title", WINDOW_MARKER, "--hold", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
             return
-        if wpref == "wezterm" and shutil.which("wezterm"):
+        if wpref == "wezterm" and _which("wezterm"):
             p = subprocess.Popen(["wezterm", "start", "--", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
             return
         if wpref == "wt":
-            wt = shutil.which("wt.exe") or shutil.which("wt")
+            wt = _which("wt.exe") or _which("wt")
             if wt:
                 p = subprocess.Popen([wt, "new-window", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
                 try:
-                    self.controller.open_terms.append(p)
+                    self.controller.track_terminal(p)
                 except Exception:
                     pass
                 return
         # Fallback order: wt -> wezterm -> kitty -> powershell
-        wt = shutil.which("wt.exe") or shutil.which("wt")
+        wt = _which("wt.exe") or _which("wt")
         if wt:
             p = subprocess.Popen([wt, "new-window", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
             return
-        if shutil.which("wezterm"):
+        if _which("wezterm"):
             p = subprocess.Popen(["wezterm", "start", "--", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
             return
-        if shutil.which("kitty"):
+        if _which("kitty"):
             p = subprocess.Popen(["kitty", "--title", WINDOW_MARKER, "--hold", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
             try:
-                self.controller.open_terms.append(p)
+                self.controller.track_terminal(p)
             except Exception:
                 pass
             return
         # Final fallback: plain PowerShell window
         p = subprocess.Popen(["cmd", "/c", "start", "powershell", "-ExecutionPolicy", "Bypass", "-NoExit", "-NoLogo", "-Command", ps_cmd])
         try:
-            self.controller.open_terms.append(p)
+            self.controller.track_terminal(p)
         except Exception:
             pass
 
@@ -1812,30 +2283,16 @@ class ShowcaseFrame(ttk.Frame):
             f"echo; echo 'Successful. Press Enter to shutdown'; read"
         )
         # Prefer user-selected terminal; fallback to others in order
-        base = ["kitty", "wezterm", "alacritty", "gnome-terminal", "konsole", "xterm", "x-terminal-emulator"]
-        pref = getattr(self.controller, "preferences", {}).get("linux_terminal_preference", "kitty")
-        order = [pref] + [t for t in base if t != pref]
+        pref = self.controller.preferences.get("linux_terminal_preference", "kitty")
+        order = [pref] + [t for t in LINUX_SCRIPT_TERMINALS if t != pref]
         for term in order:
-            if not shutil.which(term):
+            if term not in LINUX_SCRIPT_TERMINALS or not _which(term):
                 continue
-            if term == "kitty":
-                tcmd = ["kitty", "--title", WINDOW_MARKER, "--hold", "bash", "-lc", cmd]
-            elif term == "alacritty":
-                tcmd = ["alacritty", "--title", WINDOW_MARKER, "-e", "bash", "-lc", cmd]
-            elif term == "wezterm":
-                tcmd = ["wezterm", "start", "--", "bash", "-lc", cmd]
-            elif term == "gnome-terminal":
-                tcmd = ["gnome-terminal", "--window", "--", "bash", "-lc", cmd]
-            elif term == "konsole":
-                tcmd = ["konsole", "--new-window", "-e", "bash", "-lc", cmd]
-            elif term == "xterm":
-                tcmd = ["xterm", "-e", "bash", "-lc", cmd]
-            else:  # x-terminal-emulator
-                tcmd = ["x-terminal-emulator", "-e", "bash", "-lc", cmd]
+            tcmd = [*LINUX_SCRIPT_TERMINALS[term], cmd]
             try:
                 p = subprocess.Popen(tcmd)
                 try:
-                    self.controller.open_terms.append(p)
+                    self.controller.track_terminal(p)
                 except Exception:
                     pass
                 return
@@ -1852,25 +2309,19 @@ class ShowcaseFrame(ttk.Frame):
         # then close the GUI.
         try:
             # Close terminals we spawned directly (kitty/wezterm/alacritty/wt/etc.)
-            terms = list(getattr(self.controller, "open_terms", []))
+            terms = [p for p in self.controller.take_terminals() if p]
             for p in terms:
                 try:
-                    if p and p.poll() is None:
+                    if p.poll() is None:
                         p.terminate()
                 except Exception:
                     pass
-            # brief grace period
-            time.sleep(0.2)
-            for p in terms:
+            # brief grace period (ends early once every terminal has exited)
+            for p in _wait_for_exit(terms, 0.2):
                 try:
-                    if p and p.poll() is None:
-                        p.kill()
+                    p.kill()
                 except Exception:
                     pass
-            try:
-                self.controller.open_terms = []
-            except Exception:
-                pass
         except Exception:
             pass
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Memory Regex Extract — Regression Smoke Test
+
+Checks that assignment 07's e-mail/URL scan reports exactly what the plain
+expressions report with re.findall, with every engine it can use (re, and RE2
+and Hyperscan when installed), on inputs that previously went wrong:
+- very long local parts, domains and URLs (no length caps may drop them)
+- a match that starts right where the previous one ended (after a 4-letter TLD)
+- long runs of near-miss junk, which must still scan in linear time
+
+Exit code: 0 on success; non-zero if any case differs.
+
+Usage:
+  python3 scripts/e2e_regex_extract_smoke.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+
+MODULE_PATH = (Path(__file__).resolve().parent.parent
+               / 'assignments' / '07_memory_regex_extract' / '07_memory_regex_extract.py')
+
+# The original expressions, without lookbehinds or caps
+BASE_EMAIL = re.compile(rb'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,4}')
+BASE_URL = re.compile(rb'\w+:\/\/[\w@][\w.:@]+\/?[\w\.?=%&=\-@$,]*')
+
+CASES = {
+    'long local part and domain': (b'a' * 100 + b'user@example.com ... bob@' + b'd' * 300
+                                   + b'.com ... good@site.net'),
+    'match right after a TLD': b'x a@b.comfoo@bar.com y a@b.comm.x@y.org',
+    'long URL': b'see https://' + b'h' * 3000 + b'.example/' + b'p' * 5000 + b'?q=1 end',
+    'URLs and e-mails mixed': b'\x00http://a.b/c mailto:me@host.io\xffftp://x@y:21/z',
+}
+
+# (label, data) cases that time the scan on junk; a quadratic scan takes minutes on these
+JUNK_CASES = {
+    'local-part junk': b'a' * (1 << 20) + b'@',
+    'scheme junk': b'a' * (1 << 20) + b':/',
+}
+JUNK_SECONDS = 5.0
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location('memory_regex_extract', MODULE_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def scan(mod, data: bytes) -> tuple[list, list]:
+    emails, urls = mod.scanBuffer(data)
+    return list(emails), list(urls)
+
+
+def engines(mod) -> list[tuple[str, object, object]]:
+    """(label, hsDatabase, re2Patterns) for each engine scanBuffer can pick."""
+    found = [('re', None, None)]
+    if mod.re2Patterns is not None:
+        found.append(('RE2', None, mod.re2Patterns))
+    if mod.hsDatabase is not None:
+        found.append(('Hyperscan', mod.hsDatabase, None))
+    return found
+
+
+def main() -> int:
+    mod = load_module()
+
+    all_ok = True
+    for engine, hs_db, re2_patterns in engines(mod):
+        # scanBuffer prefers Hyperscan, then RE2, then re; force one at a time
+        mod.hsDatabase = hs_db
+        mod.re2Patterns = re2_patterns
+        print(f'[{engine}]')
+
+        for label, data in CASES.items():
+            expected = (BASE_EMAIL.findall(data), BASE_URL.findall(data))
+            ok = scan(mod, data) == expected
+            print(f" - {label}: {'OK' if ok else 'FAIL'}")
+            all_ok = all_ok and ok
+
+        for label, data in JUNK_CASES.items():
+            t0 = time.perf_counter()
+            scan(mod, data)
+            elapsed = time.perf_counter() - t0
+            ok = elapsed < JUNK_SECONDS
+            print(f" - {label}: {elapsed:.2f}s {'OK' if ok else 'FAIL'}")
+            all_ok = all_ok and ok
+
+    if not all_ok:
+        print('\nOne or more cases failed.', file=sys.stderr)
+    return 0 if all_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
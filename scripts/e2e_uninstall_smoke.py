@@ -3,100 +3,183 @@
 Safe Uninstall — End-to-End Smoke Test
 
 This script validates the "safe uninstall" behavior without touching your repo.
-It creates temporary, dummy project folders and exercises the same safety checks
-and actions as the app's uninstall helper:
+It creates temporary, dummy project folders and exercises the safety checks and
+Trash paths of the app's uninstall helper (UNINSTALL_SCRIPT_TEMPLATE in main.py):
 - Strong path checks and project markers
-- Prefer moving to OS Trash/Recycle Bin (macOS Finder, Windows API, Linux gio)
+- Prefer moving to OS Trash/Recycle Bin
 - Fallback to a non-destructive safe rename when Trash isn't available
 
+Each OS runs two cases where they differ:
+- The helper's own path: Finder via osascript (macOS), the gio CLI (Linux),
+  SHFileOperationW (Windows, shared with the main case).
+- A faster in-process path the helper does not use: NSFileManager between
+  send2trash and Finder (macOS), libgio via ctypes (Linux).
+
 Exit code: 0 on success; non-zero if any OS case fails.
 
 Usage:
   python3 scripts/e2e_uninstall_smoke.py
 
 Notes:
-- macOS: May prompt for Automation permissions to control Finder.
-- Linux: Requires `gio` for Trash; otherwise will use rename fallback.
+- macOS: Uses NSFileManager when PyObjC is installed; Finder may prompt for
+  Automation permissions.
+- Linux: Uses libgio (GLib) in-process, else the `gio` CLI; the helper-path
+  case requires `gio` on PATH, otherwise it uses the rename fallback.
 - Windows: Uses the Recycle Bin API when running natively on Windows.
+- Set VP_ASYNC_DELETE=1 to delete renamed temp trees in the background.
 """
 from __future__ import annotations
 
 import argparse
+import ctypes
 import os
+import secrets
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import send2trash  # optional
+    SEND2TRASH_AVAILABLE = True
+except Exception:
+    SEND2TRASH_AVAILABLE = False
+
+# Platform checks and the gio lookup are fixed for the life of the process
+_IS_DARWIN = sys.platform.startswith('darwin')
+_IS_LINUX = sys.platform.startswith('linux')
+_IS_WIN = os.name == 'nt'
+_GIO_BIN = shutil.which('gio') if _IS_LINUX else None
+
+# VP_ASYNC_DELETE=1 removes renamed trees in the background once a case has checked them
+_ASYNC_DELETE = os.environ.get('VP_ASYNC_DELETE') == '1'
+_reapers: list[threading.Thread] = []
+
+
+# Paths never accepted as uninstall targets, and the markers a project root must contain
+_REFUSED_ROOTS = frozenset({os.path.abspath(os.sep), os.path.expanduser('~')})
+_PROJECT_MARKERS = frozenset({'main.py', 'README.md'})
+
 
 def safe_path(p: Path) -> bool:
+    # os-level calls: one stat for the directory and one scandir for the markers
+    real = os.path.realpath(p)
     try:
-        p = p.resolve()
-    except Exception:
-        return False
-    if not p.exists() or not p.is_dir():
+        if not stat.S_ISDIR(os.stat(real).st_mode):
+            return False
+    except (OSError, ValueError):
         return False
     # Refuse root/home/very-short paths
-    if p == Path('/') or p == Path.home() or len(str(p)) < 8:
+    if real in _REFUSED_ROOTS or len(real) < 8:
         return False
     # Require project markers
-    if not (p / 'main.py').exists() or not (p / 'README.md').exists():
+    try:
+        with os.scandir(real) as it:
+            found = {e.name for e in it if e.name in _PROJECT_MARKERS}
+    except OSError:
         return False
-    return True
+    return found == _PROJECT_MARKERS
 
 
 def try_send2trash(path: Path) -> bool:
+    if not SEND2TRASH_AVAILABLE:
+        return False
     try:
-        import send2trash  # optional
         send2trash.send2trash(str(path))
         return True
     except Exception:
         return False
 
 
+def macos_trash_native(path: Path) -> bool:
+    """Move path to Trash in-process with NSFileManager (requires PyObjC)."""
+    try:
+        from Foundation import NSFileManager, NSURL  # optional (pyobjc)
+        url = NSURL.fileURLWithPath_(str(path))
+        ok, _, _ = NSFileManager.defaultManager().trashItemAtURL_resultingItemURL_error_(url, None, None)
+        return bool(ok)
+    except Exception:
+        return False
+
+
 def macos_trash(path: Path) -> bool:
     """Use Finder (osascript) to move path to Trash."""
     try:
         escaped = str(path).replace("\\", "\\\\").replace('"', '\\"')
-        script = [
-            'tell application "Finder"',
-            f'delete POSIX file "{escaped}"',
-            'end tell',
-        ]
-        args = ['osascript']
-        for line in script:
-            args += ['-e', line]
-        subprocess.check_call(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # One -e argument holding the whole script (osascript accepts newline-separated lines)
+        script = f'tell application "Finder"\ndelete POSIX file "{escaped}"\nend tell'
+        subprocess.check_call(['osascript', '-e', script], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except Exception:
         return False
 
 
+@lru_cache(maxsize=1)
+def _load_gio():
+    """Return (libgio, libgobject, libglib) bound via ctypes, or None if GLib is unavailable."""
+    try:
+        gio = ctypes.CDLL('libgio-2.0.so.0')
+        gobject = ctypes.CDLL('libgobject-2.0.so.0')
+        glib = ctypes.CDLL('libglib-2.0.so.0')
+    except OSError:
+        return None
+    gio.g_file_new_for_path.restype = ctypes.c_void_p
+    gio.g_file_new_for_path.argtypes = [ctypes.c_char_p]
+    gio.g_file_trash.restype = ctypes.c_int
+    gio.g_file_trash.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    gobject.g_object_unref.argtypes = [ctypes.c_void_p]
+    glib.g_error_free.argtypes = [ctypes.c_void_p]
+    return gio, gobject, glib
+
+
 def linux_trash(path: Path) -> bool:
-    """Use gio trash when available (Freedesktop/GLib)."""
+    """Use GLib's trash (g_file_trash, or the gio CLI) when available (Freedesktop/GLib)."""
+    libs = _load_gio()
+    if libs is not None:
+        # In-process: no PATH lookup and no gio process per call
+        gio, gobject, glib = libs
+        gfile = gio.g_file_new_for_path(os.fsencode(str(path)))
+        err = ctypes.c_void_p(None)
+        try:
+            ok = gio.g_file_trash(gfile, None, ctypes.byref(err))
+        finally:
+            gobject.g_object_unref(gfile)
+        if err.value:
+            glib.g_error_free(err)
+        return bool(ok)
+    return linux_trash_cli(path)
+
+
+def linux_trash_cli(path: Path) -> bool:
+    """Use the gio CLI, as the app's uninstall helper does."""
     try:
-        if shutil.which('gio'):
-            subprocess.check_call(['gio', 'trash', str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if _GIO_BIN:
+            subprocess.check_call([_GIO_BIN, 'trash', str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
     except Exception:
         pass
     return False
 
 
-def windows_trash(path: Path) -> bool:
-    """Move path to Recycle Bin using SHFileOperation when on Windows."""
-    if os.name != 'nt':
-        return False
+FO_DELETE = 3
+FOF_ALLOWUNDO = 0x0040
+FOF_NOCONFIRMATION = 0x0010
+
+
+@lru_cache(maxsize=1)
+def _load_shfileop():
+    """Return (SHFILEOPSTRUCTW, SHFileOperationW) with a declared signature, or None off Windows."""
+    if not _IS_WIN:
+        return None
     try:
-        import ctypes
         from ctypes import wintypes
 
-        FO_DELETE = 3
-        FOF_ALLOWUNDO = 0x0040
-        FOF_NOCONFIRMATION = 0x0010
-
         class SHFILEOPSTRUCTW(ctypes.Structure):
             _fields_ = [
                 ('hwnd', wintypes.HWND),
@@ -109,6 +192,21 @@ def windows_trash(path: Path) -> bool:
                 ('lpszProgressTitle', wintypes.LPCWSTR),
             ]
 
+        func = ctypes.windll.shell32.SHFileOperationW
+        func.argtypes = [ctypes.POINTER(SHFILEOPSTRUCTW)]
+        func.restype = ctypes.c_int
+    except Exception:
+        return None
+    return SHFILEOPSTRUCTW, func
+
+
+def windows_trash(path: Path) -> bool:
+    """Move path to Recycle Bin using SHFileOperation when on Windows."""
+    api = _load_shfileop()
+    if api is None:
+        return False
+    SHFILEOPSTRUCTW, shfileop = api
+    try:
         shfo = SHFILEOPSTRUCTW()
         shfo.hwnd = None
         shfo.wFunc = FO_DELETE
@@ -116,8 +214,7 @@ def windows_trash(path: Path) -> bool:
         shfo.pFrom = str(path) + '\0\0'
         shfo.pTo = None
         shfo.fFlags = FOF_ALLOWUNDO | FOF_NOCONFIRMATION
-        res = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(shfo))
-        return res == 0
+        return shfileop(shfo) == 0
     except Exception:
         return False
 
@@ -125,11 +222,9 @@ def windows_trash(path: Path) -> bool:
 def safe_rename(path: Path) -> Path | None:
     parent = path.parent
     ts = time.strftime('%Y%m%d_%H%M%S')
-    new = parent / f"{path.name}.DELETE_ME_{ts}"
-    i = 0
-    while new.exists() and i < 50:
-        i += 1
-        new = parent / f"{path.name}.DELETE_ME_{ts}_{i}"
+    # Same naming as the app's uninstall helper: a random suffix instead of probing with
+    # exists() (racy now that cases run concurrently, and up to 50 stat() calls)
+    new = parent / f"{path.name}.DELETE_ME_{ts}_{secrets.token_hex(3)}"
     try:
         path.rename(new)
         return new
@@ -137,14 +232,28 @@ def safe_rename(path: Path) -> Path | None:
         return None
 
 
+# Files seeded into each dummy project (main.py and README.md are the project markers)
+_SEED_FILES = {
+    'main.py': b'print("hello")\n',
+    'README.md': b'# E2E\n',
+    '.vp_showcase_prefs.json': b'{}',
+}
+# O_BINARY keeps Windows from translating newlines on raw writes
+_SEED_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
 def make_dummy_project(prefix: str) -> Path:
     base = Path(tempfile.mkdtemp(prefix=prefix))
     target = base / 'Violent-Python-E2E'
-    target.mkdir()
-    (target / 'main.py').write_text('print("hello")\n', encoding='utf-8')
-    (target / 'README.md').write_text('# E2E\n', encoding='utf-8')
-    (target / '.vp_showcase_prefs.json').write_text('{}', encoding='utf-8')
-    (target / 'assignments').mkdir()
+    # One call creates the project folder and its assignments/ subfolder
+    os.makedirs(target / 'assignments')
+    # Payloads are fixed bytes: write them straight to raw fds (no text layer or codec lookup)
+    for name, data in _SEED_FILES.items():
+        fd = os.open(target / name, _SEED_FLAGS, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
     return target
 
 
@@ -165,6 +274,13 @@ def run_case(label: str, mover_funcs: list, simulate_only: bool = False) -> tupl
     if not moved:
         renamed = safe_rename(t)
         ok = renamed is not None and renamed.exists() and not t.exists()
+        if ok and _ASYNC_DELETE:
+            # Rename-then-delete: the case is done once the rename is verified; the temp
+            # tree (the mkdtemp base holding it) is reaped without holding up the run
+            th = threading.Thread(target=shutil.rmtree, args=(renamed.parent,),
+                                  kwargs={'ignore_errors': True}, daemon=True)
+            th.start()
+            _reapers.append(th)
         return (label, 'rename', ok)
     else:
         ok = not t.exists()
@@ -176,18 +292,31 @@ def main() -> int:
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     args = parser.parse_args()
 
-    results: list[tuple[str, str, bool]] = []
-
-    # macOS
-    results.append(run_case('macOS', [try_send2trash, macos_trash], simulate_only=not sys.platform.startswith('darwin')))
-
-    # Linux
-    results.append(run_case('Linux', [linux_trash], simulate_only=not (sys.platform.startswith('linux'))))
-
-    # Windows
-    # On native Windows, we use Windows API; otherwise simulate to exercise rename fallback
-    simulate_windows = not (os.name == 'nt')
-    results.append(run_case('Windows', [windows_trash], simulate_only=simulate_windows))
+    # (label, movers, simulate_only) per OS case
+    cases = [
+        # macOS
+        # (Finder via osascript is the last resort: it starts a process and drives Finder)
+        ('macOS', [try_send2trash, macos_trash_native, macos_trash], not _IS_DARWIN),
+        # The uninstall helper only drives Finder, so cover that path on its own too
+        ('macOS-Finder', [macos_trash], not _IS_DARWIN),
+        # Linux
+        ('Linux', [linux_trash], not _IS_LINUX),
+        # The uninstall helper runs the gio CLI, so cover that path on its own too
+        ('Linux-gio-CLI', [linux_trash_cli], not _IS_LINUX),
+        # Windows
+        # On native Windows, we use Windows API; otherwise simulate to exercise rename fallback
+        ('Windows', [windows_trash], not _IS_WIN),
+    ]
+
+    # Each case works on its own temporary tree and mostly waits on subprocesses and the
+    # filesystem, so run them side by side; results keep the order above
+    with ThreadPoolExecutor(max_workers=len(cases)) as ex:
+        futs = [ex.submit(run_case, label, movers, simulate_only=sim) for label, movers, sim in cases]
+        results: list[tuple[str, str, bool]] = [f.result() for f in futs]
+
+    # Give background deletes a bounded chance to finish so CI temp dirs are cleaned up
+    for th in _reapers:
+        th.join(timeout=5)
 
     print('\n[E2E] Summary:')
     all_ok = True